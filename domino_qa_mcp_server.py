@@ -1,6 +1,8 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from mcp.server.fastmcp import FastMCP
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import asyncio
 import os
 from dotenv import load_dotenv
@@ -8,10 +10,20 @@ import webbrowser
 import json
 import time
 import datetime
+import functools
+import io
 import concurrent.futures
 import threading
+from array import array
+from collections import Counter
 from pathlib import Path
+from types import MappingProxyType
 import sys
+import logging
+import logging.handlers
+import atexit
+import queue
+import statistics
 # Try to import domino library, but don't fail if it's not available
 try:
     from domino import Domino
@@ -19,7 +31,24 @@ try:
 except ImportError:
     DOMINO_AVAILABLE = False
     Domino = None
+# Prefer orjson for parsing large Domino responses (e.g. job stdout), fall back to stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+# ijson lets large project lists be scanned incrementally; optional, whole-body parsing is used without it
+try:
+    import ijson
+except ImportError:
+    ijson = None
 import tempfile
+import traceback
+import urllib.parse
 import uuid
 import re
 
@@ -35,24 +64,96 @@ if not domino_api_key:
 if not domino_host:
     raise ValueError("DOMINO_HOST environment variable not set.")
 
-# Initialize the Fast MCP server
-mcp = FastMCP("domino_qa_server")
-
-def _create_domino_client(user_name: str, project_name: str) -> Domino:
-    """Create a Domino client instance for the specified project"""
-    project_path = f"{user_name}/{project_name}"
-    
-    return Domino(
-        project=project_path,
-        api_key=domino_api_key,
-        host=domino_host  # Use full URL format that works
-    )
-
-
+# Suite progress goes to stderr so it never interleaves with MCP stdio frames. Only the
+# qa_mcp logger is configured; the root logger is left to FastMCP and the libraries.
+log = logging.getLogger("qa_mcp")
+log.setLevel(logging.INFO)
+log.propagate = False
+_LOG_HANDLER = logging.StreamHandler(sys.stderr)
+_LOG_HANDLER.setFormatter(logging.Formatter("%(message)s"))
+# qa_mcp records are formatted and written by a background listener thread, so concurrent
+# perf-test workers only enqueue a record instead of contending for the stderr lock
+_LOG_QUEUE = queue.SimpleQueue()
+_LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, _LOG_HANDLER)
+log.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)
+
+# Standard Domino REST headers, built once at import and shared read-only by every helper
+_AUTH_HEADERS = MappingProxyType({
+    "X-Domino-Api-Key": domino_api_key,
+    "Content-Type": "application/json"
+})
+
+# Shared keep-alive connection pool so repeated Domino REST calls skip the TCP/TLS handshake.
+# Idempotent requests are retried on transient gateway errors; raise_on_status=False hands
+# the final response back so callers still see the real status code.
+_RETRY = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_RETRY))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_RETRY))
+# Only the API key is a session default: requests sets Content-Type itself for json= and
+# files= bodies, and a default JSON content type would clobber multipart boundaries.
+_SESSION.headers["X-Domino-Api-Key"] = domino_api_key
+
+# stress_test_api gets its own session with retries disabled: 429s and 5xx responses must show
+# up in its success rate, error counts and latencies instead of being retried away. The pool is
+# sized for its largest documented fan-out (1000 workers); urllib3 only opens sockets on demand.
+_STRESS_POOL_MAXSIZE = 1024
+_STRESS_SESSION = requests.Session()
+_STRESS_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=_STRESS_POOL_MAXSIZE, max_retries=0))
+_STRESS_SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=_STRESS_POOL_MAXSIZE, max_retries=0))
+_STRESS_SESSION.headers["X-Domino-Api-Key"] = domino_api_key
+
+# TTL cache for Domino lookups that change on human timescales: (func name, key) -> (expires_at, value).
+# Entries are keyed per project and per tier, so the dict is bounded for long-lived servers.
+_TTL_CACHE: Dict[tuple, tuple] = {}
+_TTL_CACHE_MAX_ENTRIES = 1024
+
+def _ttl_cached(ttl: float, key=None):
+    """
+    Cache a function's successful results for ttl seconds.
+    key(*args, **kwargs) builds the cache key (defaults to the positional args). Empty results
+    and error dicts are never cached, so failed lookups are retried on the next call.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = (func.__name__, key(*args, **kwargs) if key else args)
+            now = time.monotonic()
+            hit = _TTL_CACHE.get(cache_key)
+            if hit:
+                if hit[0] > now:
+                    return hit[1]
+                # Expired entries are evicted on read
+                _TTL_CACHE.pop(cache_key, None)
+            value = func(*args, **kwargs)
+            if value and not (isinstance(value, dict) and "error" in value):
+                if len(_TTL_CACHE) >= _TTL_CACHE_MAX_ENTRIES:
+                    _ttl_cache_prune(now)
+                _TTL_CACHE[cache_key] = (now + ttl, value)
+            return value
+        return wrapper
+    return decorator
+
+def _ttl_cache_prune(now: float) -> None:
+    """Drop expired entries; if the cache is still full, drop the oldest entries to make room"""
+    for cache_key, (expires_at, _) in list(_TTL_CACHE.items()):
+        if expires_at <= now:
+            _TTL_CACHE.pop(cache_key, None)
+    while len(_TTL_CACHE) >= _TTL_CACHE_MAX_ENTRIES:
+        _TTL_CACHE.pop(next(iter(_TTL_CACHE)), None)
+
+def _ttl_cache_invalidate(func_name: str, cache_key: tuple) -> None:
+    """Drop a cached lookup after a call that changes the underlying resource"""
+    _TTL_CACHE.pop((func_name, cache_key), None)
 
 # Initialize the Fast MCP server
 mcp = FastMCP("domino_qa_server")
 
+# Clients are cached per project so every test against it reuses one instance, and with it the
+# client's keep-alive connections; construction failures are not cached and are retried
+@functools.lru_cache(maxsize=32)
 def _create_domino_client(user_name: str, project_name: str) -> Domino:
     """Create a Domino client instance for the specified project"""
     if not DOMINO_AVAILABLE:
@@ -66,6 +167,7 @@ def _create_domino_client(user_name: str, project_name: str) -> Domino:
         host=domino_host  # Use full URL format that works
     )
 
+@_ttl_cached(ttl=60, key=lambda user_name, project_name, headers: (user_name, project_name))
 def _get_project_id(user_name: str, project_name: str, headers: dict) -> Optional[str]:
     """
     Get the numeric project ID from user name and project name.
@@ -79,38 +181,48 @@ def _get_project_id(user_name: str, project_name: str, headers: dict) -> Optiona
         str or None: The numeric project ID if found, None otherwise
     """
     try:
-        # Try listing projects and searching (most reliable method)
+        # Ask the server for the single matching project first, so the full project list
+        # only has to be fetched and scanned when the lookup endpoint is unavailable
+        lookup_result = _make_api_request(
+            "GET",
+            f"{domino_host}/v4/gateway/projects/findProjectByOwnerAndName",
+            headers,
+            params={"ownerName": user_name, "projectName": project_name}
+        )
+        if isinstance(lookup_result, dict) and "error" not in lookup_result and lookup_result.get("id"):
+            return lookup_result["id"]
+        
+        # Fall back to listing projects and searching
         list_endpoints = [
-            (f"{domino_host}/v4/gateway/projects", {"relationship": "Owned", "showCompleted": "false"}),
-            (f"{domino_host}/v4/projects", {"pageSize": 1000}),
-            (f"{domino_host}/api/projects/v1/projects", {})
+            (f"{domino_host}/v4/gateway/projects", {"relationship": "Owned", "showCompleted": "false"}, _projects_from_list, "item"),
+            (f"{domino_host}/v4/projects", {"pageSize": 1000}, _projects_from_list, "item"),
+            (f"{domino_host}/api/projects/v1/projects", {}, _projects_from_data, "data.item")
         ]
         
-        for endpoint, params in list_endpoints:
-            projects_result = _make_api_request("GET", endpoint, headers, params=params)
-            
-            # Skip if this endpoint failed
-            if "error" in projects_result:
+        # A plain project name is serialized verbatim as a quoted JSON string, so a list body
+        # that does not contain it cannot hold the project and is skipped without parsing
+        name_needle = f'"{project_name}"'.encode() if _PLAIN_NAME_RE.fullmatch(project_name) else None
+        
+        for endpoint, params, extract_projects, items_prefix in list_endpoints:
+            if ijson is not None:
+                project_id = _stream_project_id(endpoint, headers, params, items_prefix, user_name, project_name)
+                if project_id:
+                    return project_id
                 continue
             
-            projects: List[dict] = []
-            if isinstance(projects_result, list):
-                projects = projects_result
-            elif isinstance(projects_result, dict):
-                data = projects_result.get("data")
-                if isinstance(data, list):
-                    projects = data
+            content = _get_raw_response(endpoint, headers, params=params)
             
-            # Search for the project
-            for project in projects:
-                if project.get("name") != project_name:
-                    continue
-                owner_username = (
-                    project.get("ownerUsername") or
-                    project.get("ownerName") or
-                    (project.get("owner") or {}).get("username")
-                )
-                if owner_username == user_name:
+            # Skip if this endpoint failed or cannot contain the project
+            if content is None or (name_needle is not None and name_needle not in content):
+                continue
+            try:
+                projects_result = _json_loads(content)
+            except ValueError:
+                continue
+            
+            # Search for the project; the owner is only resolved for name matches
+            for project in extract_projects(projects_result):
+                if project.get("name") == project_name and _project_owner_username(project) == user_name:
                     project_id = project.get("id")
                     if project_id:
                         return project_id
@@ -120,18 +232,58 @@ def _get_project_id(user_name: str, project_name: str, headers: dict) -> Optiona
         print(f"❌ Error getting project ID for {user_name}/{project_name}: {e}")
         return None
 
+def _project_owner_username(project: dict) -> Optional[str]:
+    """Owner username of a project object, whichever field the endpoint reports it in"""
+    return (
+        project.get("ownerUsername") or
+        project.get("ownerName") or
+        (project.get("owner") or {}).get("username")
+    )
+
+def _projects_from_list(body: Any) -> List[dict]:
+    """Project objects from endpoints that return a bare JSON array"""
+    return body if isinstance(body, list) else []
+
+def _projects_from_data(body: Any) -> List[dict]:
+    """Project objects from endpoints that wrap the array in a "data" key"""
+    data = body.get("data") if isinstance(body, dict) else None
+    return data if isinstance(data, list) else []
+
+def _stream_project_id(endpoint: str, headers: Dict[str, str], params: Optional[Dict], items_prefix: str, user_name: str, project_name: str) -> Optional[str]:
+    """Stream a project list response through ijson and stop reading at the first matching project"""
+    try:
+        with _SESSION.get(endpoint, headers=headers, params=params, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            for project in ijson.items(response.raw, items_prefix):
+                if (isinstance(project, dict) and project.get("name") == project_name
+                        and _project_owner_username(project) == user_name and project.get("id")):
+                    return project["id"]
+    except (requests.exceptions.RequestException, ijson.JSONError):
+        return None
+    return None
+
+# Names made only of these characters need no escaping inside a JSON string
+_PLAIN_NAME_RE = re.compile(r"[A-Za-z0-9_.\- ]+")
+
+def _get_raw_response(endpoint: str, headers: Dict[str, str], params: Optional[Dict] = None, timeout_seconds: int = 60) -> Optional[bytes]:
+    """GET an endpoint through the pooled session and return the undecoded body, or None on failure"""
+    try:
+        response = _SESSION.get(endpoint, headers=headers, params=params, timeout=timeout_seconds)
+        response.raise_for_status()
+        return response.content
+    except requests.exceptions.RequestException:
+        return None
+
 def _generate_unique_name(prefix: str) -> str:
     """Generate a unique name with timestamp and UUID"""
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    short_uuid = str(uuid.uuid4())[:8]
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    short_uuid = uuid.uuid4().hex[:8]
     return f"{prefix}_{timestamp}_{short_uuid}"
 
 def _check_api_endpoint_exists(endpoint: str) -> bool:
     """Check if an API endpoint exists before using it"""
-    headers = {
-        "X-Domino-Api-Key": domino_api_key,
-        "Content-Type": "application/json"
-    }
+    headers = _AUTH_HEADERS
     
     try:
         result = _make_api_request("GET", endpoint, headers)
@@ -142,10 +294,7 @@ def _check_api_endpoint_exists(endpoint: str) -> bool:
 def _get_available_hardware_tiers() -> List[str]:
     """Get available hardware tiers from Domino platform using correct API endpoint"""
     try:
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
         # Use the correct API endpoint for hardware tiers
         params = {
@@ -173,309 +322,235 @@ def _get_available_hardware_tiers() -> List[str]:
             
             # If we found tiers, return them
             if tiers:
-                print(f"DEBUG: Found {len(tiers)} hardware tiers from API: {tiers}")
-                print(f"DEBUG: Available tier IDs: {tier_ids}")
+                log.debug("Found %d hardware tiers from API: %s", len(tiers), tiers)
+                log.debug("Available tier IDs: %s", tier_ids)
                 return tiers
             else:
-                print("DEBUG: API returned no hardware tiers, using fallback")
+                log.debug("API returned no hardware tiers, using fallback")
                 return ["small", "medium", "large"]
         else:
-            print(f"DEBUG: API request failed or returned error: {result}")
+            log.debug("API request failed or returned error: %s", result)
             # Try different fallback strategies
             return ["small", "medium", "large"]
     except Exception as e:
-        print(f"DEBUG: Exception retrieving hardware tiers: {e}")
+        log.debug("Exception retrieving hardware tiers: %s", e)
         # Use most common tier names without -k8s suffix
         return ["small", "medium", "large"]
 
 def _test_list_workspaces(headers: dict, project_id: str) -> dict:
     """List existing workspaces for the project using correct Swagger API"""
-    try:
-        # Use the correct Swagger API endpoint
-        url = f"{domino_host}/v4/workspace/project/{project_id}/workspace"
-        params = {
-            "offset": 0,
-            "limit": 100
+    # Use the correct Swagger API endpoint
+    url = f"{domino_host}/v4/workspace/project/{project_id}/workspace"
+    params = {
+        "offset": 0,
+        "limit": 100
+    }
+    
+    result = _make_api_request("GET", url, headers, params=params)
+    
+    if "error" not in result:
+        return {
+            "success": True,
+            "endpoint": "/workspace/project/{projectId}/workspace",
+            "data": result,
+            "workspace_count": len(result.get("workspaces", [])) if isinstance(result, dict) else len(result),
+            "message": f"Successfully listed workspaces for project {project_id}"
         }
-        
-        result = _make_api_request("GET", url, headers, params=params)
-        
-        if "error" not in result:
-            return {
-                "success": True,
-                "endpoint": "/workspace/project/{projectId}/workspace",
-                "data": result,
-                "workspace_count": len(result.get("workspaces", [])),
-                "message": f"Successfully listed workspaces for project {project_id}"
-            }
-        else:
-            return {
-                "success": False,
-                "endpoint": "/workspace/project/{projectId}/workspace",
-                "error": result.get("error"),
-                "message": f"Failed to list workspaces for project {project_id}"
-            }
-            
-    except Exception as e:
+    else:
         return {
             "success": False,
             "endpoint": "/workspace/project/{projectId}/workspace",
-            "error": str(e),
-            "message": f"Exception while listing workspaces for project {project_id}"
+            "error": result.get("error"),
+            "message": f"Failed to list workspaces for project {project_id}"
         }
 
+# Lowercased workspace tool tuples keyed by the requested tools; almost every call asks for ("jupyter",)
+_NORMALIZED_TOOLS_CACHE: Dict[tuple, tuple] = {("jupyter",): ("jupyter",)}
+
+def _normalize_tools(tools: Optional[list]) -> tuple:
+    """Lowercase the requested workspace tools, defaulting to Jupyter"""
+    key = tuple(tools) if tools else ("jupyter",)
+    normalized = _NORMALIZED_TOOLS_CACHE.get(key)
+    if normalized is None:
+        normalized = _NORMALIZED_TOOLS_CACHE[key] = tuple(t.lower() for t in key)
+    return normalized
+
+def _build_workspace_request(name: str, environment_id: str, hardware_tier: Optional[str] = None, tools: Optional[list] = None) -> dict:
+    """Build the Swagger request body for POST /workspace/project/{projectId}/workspace"""
+    request_body = {
+        "name": name,
+        "tools": _normalize_tools(tools),
+        # Tuples serialize as JSON arrays, so the immutable values can be shared between requests
+        "externalVolumeMounts": (),
+        "environmentId": environment_id,
+        # Prefer to use active revision per Swagger oneOf
+        "environmentRevisionSpec": "ActiveRevision"
+    }
+    
+    # Only add hardware tier if we have a valid one
+    if hardware_tier:
+        request_body["hardwareTierId"] = {"value": hardware_tier}
+    
+    return request_body
+
 def _test_create_workspace(headers: dict, project_id: str, user_name: str = None, project_name: str = None, tools: list | None = None, hardware_tier_override: str | None = None) -> dict:
     """Create a new workspace using correct Swagger API"""
+    # Use the correct Swagger API endpoint for creating workspace
+    url = f"{domino_host}/v4/workspace/project/{project_id}/workspace"
+    
+    # Get hardware tier for the workspace from the override, or the default non-Model API tier.
+    # Without an override the tier is only set when tier data resolved one; otherwise the field
+    # is left out so the server picks its own default rather than a guessed "small-k8s".
     try:
-        # Use the correct Swagger API endpoint for creating workspace
-        url = f"{domino_host}/v4/workspace/project/{project_id}/workspace"
-        
-        # Get hardware tier for the workspace from server data or override
-        hardware_tier = None
-        try:
-            if hardware_tier_override:
-                hardware_tier = _validate_hardware_tier(hardware_tier_override)
-            else:
-                tier_data = _get_hardware_tier_data()
-                # Prefer default non-Model API tier
-                non_model_tiers = [t for t in tier_data if not t.get('flags', {}).get('isModelApiTier', False)]
-                default_tier = next((t for t in non_model_tiers if t.get('flags', {}).get('isDefault')), None)
-                chosen_tier = default_tier or (non_model_tiers[0] if non_model_tiers else (tier_data[0] if tier_data else None))
-                if isinstance(chosen_tier, dict):
-                    hardware_tier = chosen_tier.get('id')
-        except Exception:
+        if hardware_tier_override or _get_hardware_tier_data():
+            hardware_tier = _validate_hardware_tier(hardware_tier_override)
+        else:
             hardware_tier = None
-        
-        # Determine a suitable environmentId (align with start_workspace helper)
-        environment_id = None
-        try:
-            # 1) Prefer useable environments for this project
-            useable_envs = _make_api_request("GET", f"{domino_host}/v4/projects/{project_id}/useableEnvironments", headers)
-            if isinstance(useable_envs, list) and useable_envs:
-                default_env = next((e for e in useable_envs if isinstance(e, dict) and (e.get("isDefault") or e.get("default"))), None)
-                chosen = default_env or useable_envs[0]
-                if isinstance(chosen, dict):
-                    environment_id = chosen.get("id") or chosen.get("environmentId")
-            
-            # 2) Fall back to default environment endpoint
-            if not environment_id:
-                default_env_result = _make_api_request("GET", f"{domino_host}/v4/environments/defaultEnvironment", headers)
-                if isinstance(default_env_result, dict):
-                    environment_id = default_env_result.get("id")
-            
-            # 3) Fall back to listing environments the user can access
-            if not environment_id:
-                envs_result = _make_api_request("GET", f"{domino_host}/v4/environments/self", headers)
-                if isinstance(envs_result, list) and envs_result:
-                    default_env = next((e for e in envs_result if isinstance(e, dict) and e.get("isDefault")), None)
-                    python_env = next((e for e in envs_result if isinstance(e, dict) and "python" in e.get("name", "").lower()), None)
-                    chosen = default_env or python_env or envs_result[0]
-                    if isinstance(chosen, dict):
-                        environment_id = chosen.get("id")
-        except Exception:
-            environment_id = None
-
-        # Fallback: derive environmentId from recent project runs if available
-        if not environment_id and user_name and project_name:
-            try:
-                runs_resp = requests.get(f"{domino_host}/v1/projects/{user_name}/{project_name}/runs", headers=headers)
-                if runs_resp.status_code == 200:
-                    runs = runs_resp.json() if isinstance(runs_resp.json(), list) else runs_resp.json().get('data', [])
-                    if isinstance(runs, list):
-                        for run in reversed(runs):
-                            if isinstance(run, dict):
-                                env_id = run.get('environmentId')
-                                if env_id:
-                                    environment_id = env_id
-                                    break
-            except Exception:
-                pass
-
-        if not environment_id:
-            return {
-                "success": False,
-                "endpoint": "/workspace/project/{projectId}/workspace",
-                "error": "Could not determine environmentId",
-                "message": "Failed to find a valid environment to create workspace"
-            }
-        
-        # Create workspace request body according to Swagger spec
-        requested_tools = tools if tools else ["jupyter"]
-        request_body = {
-            "name": f"UAT Test Workspace {datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}",
-            "tools": [t.lower() for t in requested_tools],
-            "externalVolumeMounts": []
+    except Exception:
+        hardware_tier = None
+    
+    # Determine a suitable environmentId (cached per project after the first lookup)
+    environment_id = _resolve_environment_id(headers, project_id, user_name, project_name)
+    
+    if not environment_id:
+        return {
+            "success": False,
+            "endpoint": "/workspace/project/{projectId}/workspace",
+            "error": "Could not determine environmentId",
+            "message": "Failed to find a valid environment to create workspace"
         }
-        
-        # Only add hardware tier if we have a valid one
-        if hardware_tier:
-            request_body["hardwareTierId"] = {"value": hardware_tier}
-        
-        # Include environment if available
-        if environment_id:
-            request_body["environmentId"] = environment_id
-            # Prefer to use active revision per Swagger oneOf
-            request_body["environmentRevisionSpec"] = "ActiveRevision"
-        
-        result = _make_api_request("POST", url, headers, json_data=request_body)
-        
-        if "error" not in result:
-            return {
-                "success": True,
-                "endpoint": "/workspace/project/{projectId}/workspace",
-                "data": result,
-                "workspace_id": result.get("id"),
-                "workspace_name": result.get("name"),
-                "message": f"Successfully created workspace for project {project_id}"
-            }
-        else:
-            return {
-                "success": False,
-                "endpoint": "/workspace/project/{projectId}/workspace",
-                "error": result.get("error"),
-                "response_text": result.get("response_text"),
-                "request_body": request_body,
-                "message": f"Failed to create workspace for project {project_id}"
-            }
-            
-    except Exception as e:
+    
+    request_body = _build_workspace_request(
+        f"UAT Test Workspace {time.strftime('%Y%m%d-%H%M%S')}",
+        environment_id,
+        hardware_tier=hardware_tier,
+        tools=tools
+    )
+    
+    result = _make_api_request("POST", url, headers, json_data=request_body)
+    
+    if "error" not in result:
+        return {
+            "success": True,
+            "endpoint": "/workspace/project/{projectId}/workspace",
+            "data": result,
+            "workspace_id": result.get("id"),
+            "workspace_name": result.get("name"),
+            "message": f"Successfully created workspace for project {project_id}"
+        }
+    else:
         return {
             "success": False,
             "endpoint": "/workspace/project/{projectId}/workspace",
-            "error": str(e),
-            "message": f"Exception while creating workspace for project {project_id}"
+            "error": result.get("error"),
+            "response_text": result.get("response_text"),
+            "request_body": request_body,
+            "message": f"Failed to create workspace for project {project_id}"
         }
 
 def _test_start_workspace_session(headers: dict, project_id: str, workspace_create_result: dict) -> dict:
     """Start a workspace session using correct Swagger API"""
-    try:
-        # Only proceed if workspace was created successfully
-        if not workspace_create_result.get("success") or not workspace_create_result.get("workspace_id"):
-            return {
-                "success": False,
-                "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}/sessions",
-                "error": "No workspace available to start session",
-                "message": "Cannot start session without a valid workspace"
-            }
-        
-        workspace_id = workspace_create_result["workspace_id"]
-        url = f"{domino_host}/v4/workspace/project/{project_id}/workspace/{workspace_id}/sessions"
-        
-        # Start workspace session (externalVolumeMounts is a required query param)
-        result = _make_api_request("POST", url, headers, params={"externalVolumeMounts": ""})
-        
-        if "error" not in result:
-            return {
-                "success": True,
-                "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}/sessions",
-                "data": result,
-                "workspace_id": workspace_id,
-                "session_id": result.get("id"),
-                "execution_id": result.get("executionId"),
-                "message": f"Successfully started workspace session for workspace {workspace_id}"
-            }
-        else:
-            return {
-                "success": False,
-                "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}/sessions",
-                "error": result.get("error"),
-                "workspace_id": workspace_id,
-                "message": f"Failed to start workspace session for workspace {workspace_id}"
-            }
-            
-    except Exception as e:
+    # Only proceed if workspace was created successfully
+    if not workspace_create_result.get("success") or not workspace_create_result.get("workspace_id"):
         return {
             "success": False,
             "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}/sessions",
-            "error": str(e),
-            "message": f"Exception while starting workspace session"
+            "error": "No workspace available to start session",
+            "message": "Cannot start session without a valid workspace"
+        }
+    
+    workspace_id = workspace_create_result["workspace_id"]
+    url = f"{domino_host}/v4/workspace/project/{project_id}/workspace/{workspace_id}/sessions"
+    
+    # Start workspace session (externalVolumeMounts is a required query param)
+    result = _make_api_request("POST", url, headers, params={"externalVolumeMounts": ""})
+    
+    if "error" not in result:
+        return {
+            "success": True,
+            "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}/sessions",
+            "data": result,
+            "workspace_id": workspace_id,
+            "session_id": result.get("id"),
+            "execution_id": result.get("executionId"),
+            "message": f"Successfully started workspace session for workspace {workspace_id}"
+        }
+    else:
+        return {
+            "success": False,
+            "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}/sessions",
+            "error": result.get("error"),
+            "workspace_id": workspace_id,
+            "message": f"Failed to start workspace session for workspace {workspace_id}"
         }
 
 def _test_stop_workspace_session(headers: dict, project_id: str, workspace_start_result: dict) -> dict:
     """Stop a workspace session using correct Swagger API"""
-    try:
-        # Only proceed if workspace session was started successfully
-        if not workspace_start_result.get("success") or not workspace_start_result.get("workspace_id"):
-            return {
-                "success": False,
-                "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}/stop",
-                "error": "No workspace session available to stop",
-                "message": "Cannot stop session without a valid workspace session"
-            }
-        
-        workspace_id = workspace_start_result["workspace_id"]
-        url = f"{domino_host}/v4/workspace/project/{project_id}/workspace/{workspace_id}/stop"
-        
-        # Stop workspace session (no body needed according to Swagger spec)
-        result = _make_api_request("POST", url, headers)
-        
-        if "error" not in result:
-            return {
-                "success": True,
-                "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}/stop",
-                "data": result,
-                "workspace_id": workspace_id,
-                "message": f"Successfully stopped workspace session for workspace {workspace_id}"
-            }
-        else:
-            return {
-                "success": False,
-                "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}/stop",
-                "error": result.get("error"),
-                "workspace_id": workspace_id,
-                "message": f"Failed to stop workspace session for workspace {workspace_id}"
-            }
-            
-    except Exception as e:
+    # Only proceed if workspace session was started successfully
+    if not workspace_start_result.get("success") or not workspace_start_result.get("workspace_id"):
         return {
             "success": False,
             "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}/stop",
-            "error": str(e),
-            "message": f"Exception while stopping workspace session"
+            "error": "No workspace session available to stop",
+            "message": "Cannot stop session without a valid workspace session"
+        }
+    
+    workspace_id = workspace_start_result["workspace_id"]
+    url = f"{domino_host}/v4/workspace/project/{project_id}/workspace/{workspace_id}/stop"
+    
+    # Stop workspace session (no body needed according to Swagger spec)
+    result = _make_api_request("POST", url, headers)
+    
+    if "error" not in result:
+        return {
+            "success": True,
+            "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}/stop",
+            "data": result,
+            "workspace_id": workspace_id,
+            "message": f"Successfully stopped workspace session for workspace {workspace_id}"
+        }
+    else:
+        return {
+            "success": False,
+            "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}/stop",
+            "error": result.get("error"),
+            "workspace_id": workspace_id,
+            "message": f"Failed to stop workspace session for workspace {workspace_id}"
         }
 
 def _test_delete_workspace(headers: dict, project_id: str, workspace_create_result: dict) -> dict:
     """Delete a workspace using correct Swagger API"""
-    try:
-        # Only proceed if workspace was created successfully
-        if not workspace_create_result.get("success") or not workspace_create_result.get("workspace_id"):
-            return {
-                "success": False,
-                "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}",
-                "error": "No workspace available to delete",
-                "message": "Cannot delete workspace without a valid workspace"
-            }
-        
-        workspace_id = workspace_create_result["workspace_id"]
-        url = f"{domino_host}/v4/workspace/project/{project_id}/workspace/{workspace_id}"
-        
-        # Delete workspace (no body needed according to Swagger spec)
-        result = _make_api_request("DELETE", url, headers)
-        
-        if "error" not in result:
-            return {
-                "success": True,
-                "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}",
-                "data": result,
-                "workspace_id": workspace_id,
-                "message": f"Successfully deleted workspace {workspace_id}"
-            }
-        else:
-            return {
-                "success": False,
-                "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}",
-                "error": result.get("error"),
-                "workspace_id": workspace_id,
-                "message": f"Failed to delete workspace {workspace_id}"
-            }
-            
-    except Exception as e:
+    # Only proceed if workspace was created successfully
+    if not workspace_create_result.get("success") or not workspace_create_result.get("workspace_id"):
         return {
             "success": False,
             "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}",
-            "error": str(e),
-            "message": f"Exception while deleting workspace"
-                 }
+            "error": "No workspace available to delete",
+            "message": "Cannot delete workspace without a valid workspace"
+        }
+    
+    workspace_id = workspace_create_result["workspace_id"]
+    url = f"{domino_host}/v4/workspace/project/{project_id}/workspace/{workspace_id}"
+    
+    # Delete workspace (no body needed according to Swagger spec)
+    result = _make_api_request("DELETE", url, headers)
+    
+    if "error" not in result:
+        return {
+            "success": True,
+            "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}",
+            "data": result,
+            "workspace_id": workspace_id,
+            "message": f"Successfully deleted workspace {workspace_id}"
+        }
+    else:
+        return {
+            "success": False,
+            "endpoint": "/workspace/project/{projectId}/workspace/{workspaceId}",
+            "error": result.get("error"),
+            "workspace_id": workspace_id,
+            "message": f"Failed to delete workspace {workspace_id}"
+        }
 
 async def start_workspace(user_name: str, project_name: str, workspace_name: str = None, hardware_tier: str = "small") -> Dict[str, Any]:
     """
@@ -508,13 +583,15 @@ async def start_workspace(user_name: str, project_name: str, workspace_name: str
             })
             return result
         
-        # Get project ID
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
+        
+        # Project ID and hardware tier are independent lookups, so fetch them concurrently;
+        # the environment lookup below needs the project ID
+        project_id, validated_tier = await asyncio.gather(
+            asyncio.to_thread(_get_project_id, user_name, project_name, headers),
+            asyncio.to_thread(_validate_hardware_tier, hardware_tier)
+        )
         
-        project_id = _get_project_id(user_name, project_name, headers)
         if not project_id:
             result.update({
                 "status": "FAILED",
@@ -527,22 +604,10 @@ async def start_workspace(user_name: str, project_name: str, workspace_name: str
         
         # Generate workspace name if not provided
         if not workspace_name:
-            workspace_name = f"UAT Workspace {datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}"
-        
-        # Get validated hardware tier
-        validated_tier = _validate_hardware_tier(hardware_tier)
-        
-        # Get default environment ID (we need this for workspace creation)
-        environments_result = _make_api_request("GET", f"{domino_host}/v4/environments", headers)
-        environment_id = None
-        if "error" not in environments_result and isinstance(environments_result, list):
-            # Find a default or suitable environment
-            for env in environments_result:
-                if env.get("name", "").lower().find("python") != -1 or env.get("isDefault"):
-                    environment_id = env.get("id")
-                    break
-            if not environment_id and environments_result:
-                environment_id = environments_result[0].get("id")  # Use first available
+            workspace_name = f"UAT Workspace {time.strftime('%Y%m%d-%H%M%S')}"
+        
+        # Pick the project's default environment ID (we need this for workspace creation)
+        environment_id = await asyncio.to_thread(_resolve_environment_id, headers, project_id, user_name, project_name)
         
         if not environment_id:
             result.update({
@@ -553,16 +618,10 @@ async def start_workspace(user_name: str, project_name: str, workspace_name: str
             return result
         
         # Create workspace using proper Domino workspace API
-        workspace_data = {
-            "name": workspace_name,
-            "environmentId": environment_id,
-            "hardwareTierId": {"value": validated_tier},
-            "tools": ["jupyter"],  # Default to Jupyter
-            "externalVolumeMounts": []  # Empty for basic setup
-        }
+        workspace_data = _build_workspace_request(workspace_name, environment_id, hardware_tier=validated_tier)
         
         # Create workspace
-        workspace_result = _make_api_request(
+        workspace_result = await _amake_api_request(
             "POST",
             f"{domino_host}/workspace/project/{project_id}/workspace",
             headers,
@@ -585,7 +644,7 @@ async def start_workspace(user_name: str, project_name: str, workspace_name: str
         }
         
         # Start workspace session
-        session_result = _make_api_request(
+        session_result = await _amake_api_request(
             "POST",
             f"{domino_host}/workspace/project/{project_id}/workspace/{workspace_id}/sessions",
             headers,
@@ -652,12 +711,9 @@ async def stop_workspace(user_name: str, project_name: str, workspace_id: str) -
     
     try:
         # Get project ID
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
-        project_id = _get_project_id(user_name, project_name, headers)
+        project_id = await asyncio.to_thread(_get_project_id, user_name, project_name, headers)
         if not project_id:
             result.update({
                 "status": "FAILED",
@@ -669,7 +725,7 @@ async def stop_workspace(user_name: str, project_name: str, workspace_id: str) -
         result["project_id"] = project_id
         
         # Stop workspace session using proper API
-        stop_result = _make_api_request(
+        stop_result = await _amake_api_request(
             "POST",
             f"{domino_host}/workspace/project/{project_id}/workspace/{workspace_id}/stop",
             headers
@@ -708,56 +764,147 @@ async def stop_workspace(user_name: str, project_name: str, workspace_id: str) -
         })
         return result
 
+# Case-insensitive "python" match used to pick a sensible default environment by name
+_PYTHON_ENV_RE = re.compile(r"python", re.IGNORECASE)
+
+@_ttl_cached(ttl=300, key=lambda headers, project_id, user_name=None, project_name=None: (project_id,))
+def _resolve_environment_id(headers: dict, project_id: str, user_name: str = None, project_name: str = None) -> Optional[str]:
+    """
+    Pick the environment ID to create a workspace with in the given project.
+    
+    The project's useable environments are tried first, which needs a single request on
+    the warm path; the default environment, the caller's own environments and finally the
+    project's recent runs are only consulted when that request fails or returns nothing usable.
+    """
+    try:
+        # 1) Prefer useable environments for this project
+        useable_envs = _make_api_request("GET", f"{domino_host}/v4/projects/{project_id}/useableEnvironments", headers)
+        if isinstance(useable_envs, list) and useable_envs:
+            default_env = next((e for e in useable_envs if isinstance(e, dict) and (e.get("isDefault") or e.get("default"))), None)
+            chosen = default_env or useable_envs[0]
+            if isinstance(chosen, dict):
+                environment_id = chosen.get("id") or chosen.get("environmentId")
+                if environment_id:
+                    return environment_id
+        
+        # 2) Fall back to default environment endpoint
+        default_env_result = _make_api_request("GET", f"{domino_host}/v4/environments/defaultEnvironment", headers)
+        if isinstance(default_env_result, dict) and default_env_result.get("id"):
+            return default_env_result["id"]
+        
+        # 3) Fall back to listing environments the user can access
+        envs_result = _make_api_request("GET", f"{domino_host}/v4/environments/self", headers)
+        if isinstance(envs_result, list) and envs_result:
+            # Single pass: stop at the default environment, remembering the first python one
+            default_env = python_env = None
+            for env in envs_result:
+                if not isinstance(env, dict):
+                    continue
+                if env.get("isDefault"):
+                    default_env = env
+                    break
+                if python_env is None and _PYTHON_ENV_RE.search(env.get("name") or ""):
+                    python_env = env
+            chosen = default_env or python_env or envs_result[0]
+            if isinstance(chosen, dict) and chosen.get("id"):
+                return chosen["id"]
+        
+        # 4) Derive environmentId from the project's most recent runs
+        if user_name and project_name:
+            runs_resp = _SESSION.get(
+                f"{domino_host}/v1/projects/{user_name}/{project_name}/runs",
+                headers=headers,
+                params={"limit": 20},
+                timeout=60
+            )
+            if runs_resp.status_code == 200:
+                runs = _json_loads(runs_resp.content)
+                if isinstance(runs, dict):
+                    runs = runs.get('data', [])
+                if isinstance(runs, list):
+                    for run in reversed(runs):
+                        if isinstance(run, dict) and run.get('environmentId'):
+                            return run['environmentId']
+    except Exception:
+        pass
+    return None
+
+# Shared stand-in for tiers without a flags object, so lookups don't allocate a new dict
+_NO_FLAGS = MappingProxyType({})
+
 def _validate_hardware_tier(tier_name: str) -> str:
     """Validate and return correct hardware tier ID with comprehensive matching"""
+    tier_id = _match_hardware_tier(tier_name)
+    
+    # If we have no tiers, use small-k8s as default. This fallback is never cached, so the
+    # next call retries the tier fetch instead of pinning a guessed tier for the full TTL.
+    if tier_id is None:
+        log.debug("No tiers available, using small-k8s as default")
+        return "small-k8s"
+    return tier_id
+
+@_ttl_cached(ttl=300)
+def _match_hardware_tier(tier_name: str) -> Optional[str]:
+    """Match tier_name against the tier data (cached alongside it); None when no tier data is available"""
     tier_data = _get_hardware_tier_data()
-    print(f"DEBUG: Available tier data: {[(t.get('id'), t.get('name')) for t in tier_data]}")
-    print(f"DEBUG: Requested tier: {tier_name}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Available tier data: %s", [(t.get('id'), t.get('name')) for t in tier_data])
+    log.debug("Requested tier: %s", tier_name)
     
-    # If we have no tiers, use small-k8s as default
     if not tier_data:
-        print("DEBUG: No tiers available, using small-k8s as default")
-        return "small-k8s"
+        return None
+    
+    # Filter out Model API tiers once; every match below only considers regular tiers
+    regular_tiers = [t for t in tier_data if not (t.get('flags') or _NO_FLAGS).get('isModelApiTier', False)]
     
-    # If the tier name is None or empty, use the default tier (excluding Model API tiers)
+    # If the tier name is None or empty, use the default tier (excluding Model API tiers),
+    # falling back to the first regular tier and then the first tier of any kind
     if not tier_name:
-        # Find the default tier that's not a Model API tier
-        regular_tiers = [t for t in tier_data if not t.get('flags', {}).get('isModelApiTier', False)]
-        default_tier = next((t for t in regular_tiers if t.get('flags', {}).get('isDefault')), 
-                          regular_tiers[0] if regular_tiers else tier_data[0])
-        tier_id = default_tier.get('id', 'small-k8s')
-        print(f"DEBUG: No tier specified, using default: {tier_id}")
+        default_tier = next((t for t in regular_tiers if (t.get('flags') or _NO_FLAGS).get('isDefault')), None)
+        tier_id = (default_tier or (regular_tiers[0] if regular_tiers else tier_data[0])).get('id', 'small-k8s')
+        log.debug("No tier specified, using default: %s", tier_id)
         return tier_id
     
-    # Try exact match against IDs
-    for tier in tier_data:
-        if tier.get('id') == tier_name:
-            print(f"DEBUG: Found exact ID match: {tier.get('id')}")
-            return tier.get('id')
+    # Try exact match against IDs; the ID set is reused for the fallback check below
+    tier_ids = {tier.get('id') for tier in tier_data}
+    if tier_name in tier_ids:
+        log.debug("Found exact ID match: %s", tier_name)
+        return tier_name
+    
+    # Index the regular (non Model API) tiers once as (id, name, id_lower, name_lower) so the
+    # exact and case-insensitive matches below are dict probes rather than repeated scans
+    candidates = [
+        (tier.get('id') or '', tier.get('name') or '', (tier.get('id') or '').lower(), (tier.get('name') or '').lower())
+        for tier in regular_tiers
+    ]
+    by_name: Dict[str, str] = {}
+    by_lower: Dict[str, Tuple[str, str]] = {}
+    for cand_id, cand_name, id_lower, name_lower in candidates:
+        by_name.setdefault(cand_name, cand_id)
+        # The earliest tier whose name or ID matches wins, as in a sequential scan
+        by_lower.setdefault(name_lower, (cand_id, cand_name))
+        by_lower.setdefault(id_lower, (cand_id, cand_name))
     
     # Try exact match against names (excluding Model API tiers)
-    for tier in tier_data:
-        if tier.get('name') == tier_name and not tier.get('flags', {}).get('isModelApiTier', False):
-            print(f"DEBUG: Found exact name match: {tier.get('name')} -> {tier.get('id')}")
-            return tier.get('id')
+    if tier_name in by_name:
+        log.debug("Found exact name match: %s -> %s", tier_name, by_name[tier_name])
+        return by_name[tier_name]
     
     # Try case-insensitive match (excluding Model API tiers)
     tier_lower = tier_name.lower()
-    for tier in tier_data:
-        if not tier.get('flags', {}).get('isModelApiTier', False):
-            if tier.get('name', '').lower() == tier_lower or tier.get('id', '').lower() == tier_lower:
-                print(f"DEBUG: Found case-insensitive match: {tier.get('name')} -> {tier.get('id')}")
-                return tier.get('id')
-    
-    # Try partial match (e.g., "small" matches "Small" or "small-k8s") excluding Model API tiers
-    for tier in tier_data:
-        if not tier.get('flags', {}).get('isModelApiTier', False):
-            tier_id = tier.get('id', '')
-            tier_name_val = tier.get('name', '')
-            if (tier_lower in tier_id.lower() or tier_lower in tier_name_val.lower() or 
-                tier_id.lower() in tier_lower or tier_name_val.lower() in tier_lower):
-                print(f"DEBUG: Found partial match: {tier.get('name')} -> {tier.get('id')}")
-                return tier.get('id')
+    if tier_lower in by_lower:
+        cand_id, cand_name = by_lower[tier_lower]
+        log.debug("Found case-insensitive match: %s -> %s", cand_name, cand_id)
+        return cand_id
+    
+    # Try partial match (e.g., "small" matches "Small" or "small-k8s") excluding Model API tiers.
+    # Only the shorter string can be contained in the longer one, so each field needs one scan.
+    tier_len = len(tier_lower)
+    for cand_id, cand_name, id_lower, name_lower in candidates:
+        id_hit = tier_lower in id_lower if tier_len <= len(id_lower) else id_lower in tier_lower
+        if id_hit or (tier_lower in name_lower if tier_len <= len(name_lower) else name_lower in tier_lower):
+            log.debug("Found partial match: %s -> %s", cand_name, cand_id)
+            return cand_id
     
     # Common fallback mappings
     fallback_mapping = {
@@ -770,24 +917,29 @@ def _validate_hardware_tier(tier_name: str) -> str:
     if requested_lower in fallback_mapping:
         fallback_id = fallback_mapping[requested_lower]
         # Check if this fallback exists
-        for tier in tier_data:
-            if tier.get('id') == fallback_id:
-                print(f"DEBUG: Found fallback match: {fallback_id}")
-                return fallback_id
+        if fallback_id in tier_ids:
+            log.debug("Found fallback match: %s", fallback_id)
+            return fallback_id
     
     # If still no match, use the default tier or first available
-    default_tier = next((t for t in tier_data if t.get('flags', {}).get('isDefault')), tier_data[0])
-    tier_id = default_tier.get('id', 'small-k8s')
-    print(f"DEBUG: No match found for '{tier_name}', using default: {tier_id}")
+    tier_id = _get_default_tier_id()
+    log.debug("No match found for '%s', using default: %s", tier_name, tier_id)
     return tier_id
 
+@_ttl_cached(ttl=300)
+def _get_default_tier_id() -> Optional[str]:
+    """ID of the tier flagged isDefault (Model API tiers included), else the first tier; None (uncached) without tier data"""
+    tier_data = _get_hardware_tier_data()
+    if not tier_data:
+        return None
+    default_tier = next((t for t in tier_data if (t.get('flags') or _NO_FLAGS).get('isDefault')), tier_data[0])
+    return default_tier.get('id', 'small-k8s')
+
+@_ttl_cached(ttl=300)
 def _get_hardware_tier_data() -> List[Dict]:
-    """Get full hardware tier data including IDs and names, with fallback to admin API"""
+    """Get full hardware tier data including IDs and names"""
     try:
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
         params = {
             "offset": 0,
@@ -795,38 +947,28 @@ def _get_hardware_tier_data() -> List[Dict]:
             "includeArchived": False
         }
         
-        # Try primary API endpoint
+        # A single request covers both response shapes; the old "admin API" fallback
+        # re-requested this same endpoint and could not return anything new
         result = _make_api_request("GET", f"{domino_host}/api/hardwaretiers/v1/hardwaretiers", headers, params=params)
         
-        if "error" not in result and isinstance(result, dict):
-            tiers = result.get("hardwareTiers", [])
-            if tiers:
-                return tiers
-        
-        # Fallback: Try admin hardware tiers API (from infrastructure management test)
-        print("   ⚠️  Primary hardware tiers API returned no data, trying admin API...")
-        admin_result = _make_api_request("GET", f"{domino_host}/api/hardwaretiers/v1/hardwaretiers", headers, params={"limit": 100, "includeArchived": False})
-        
-        if "error" not in admin_result:
-            if isinstance(admin_result, dict):
-                admin_tiers = admin_result.get("hardwareTiers", admin_result.get("data", []))
-                if admin_tiers:
-                    print(f"   ✅ Found {len(admin_tiers)} tiers via admin API")
-                    return admin_tiers
-            elif isinstance(admin_result, list):
-                if admin_result:
-                    print(f"   ✅ Found {len(admin_result)} tiers via admin API")
-                    return admin_result
-        
-            return []
+        if isinstance(result, list):
+            return result
+        if "error" not in result:
+            return result.get("hardwareTiers") or result.get("data") or []
+        return []
     except Exception as e:
-        print(f"DEBUG: Exception retrieving hardware tier data: {e}")
+        log.debug("Exception retrieving hardware tier data: %s", e)
         return []
 
+# Characters that would change the structure of a URL path if left in a parameter
+_UNSAFE_URL_CHARS = frozenset('/\\?#&=%')
+
+@functools.lru_cache(maxsize=1024)
 def _validate_url_parameter(param_value: str, param_name: str) -> str:
     """
     Validates and URL-encodes a parameter for safe use in URLs.
     Supports international characters by encoding them properly.
+    Results are memoized since the same user/project/run ids recur across tool calls.
     
     Args:
         param_value (str): The parameter value to validate and encode
@@ -838,10 +980,9 @@ def _validate_url_parameter(param_value: str, param_name: str) -> str:
     Raises:
         ValueError: If the parameter contains unsafe URL characters
     """
-    import urllib.parse
     
     # Basic safety check - reject if contains dangerous chars that could break URL structure
-    if any(char in param_value for char in ['/', '\\', '?', '#', '&', '=', '%']):
+    if not _UNSAFE_URL_CHARS.isdisjoint(param_value):
         raise ValueError(f"Invalid {param_name}: '{param_value}' contains unsafe URL characters")
     
     # URL encode to handle international characters safely
@@ -862,30 +1003,43 @@ def _make_api_request(method: str, endpoint: str, headers: Dict[str, str], data:
     Returns:
         Dict[str, Any]: API response or error information
     """
-    import requests
     
     try:
         # Use json_data if provided, otherwise fall back to data for backwards compatibility
         request_json = json_data if json_data is not None else data
         
-        if method.upper() == "GET":
-            response = requests.get(endpoint, headers=headers, params=params, timeout=timeout_seconds)
-        elif method.upper() == "POST":
-            response = requests.post(endpoint, headers=headers, json=request_json, params=params, timeout=timeout_seconds)
-        elif method.upper() == "PUT":
-            response = requests.put(endpoint, headers=headers, json=request_json, params=params, timeout=timeout_seconds)
-        elif method.upper() == "DELETE":
-            response = requests.delete(endpoint, headers=headers, params=params, timeout=timeout_seconds)
-        else:
+        method = method.upper()
+        if method not in ("GET", "POST", "PUT", "DELETE"):
             return {"error": f"Unsupported HTTP method: {method}"}
         
+        # Only POST/PUT carry a body, encoded here so orjson is used when available
+        body = None
+        if method in ("POST", "PUT") and request_json is not None:
+            body = _json_dumps(request_json)
+            if "Content-Type" not in headers:
+                headers = {**headers, "Content-Type": "application/json"}
+        
+        # All calls share the pooled session's keep-alive connections
+        response = _SESSION.request(
+            method,
+            endpoint,
+            headers=headers,
+            params=params,
+            data=body,
+            timeout=timeout_seconds
+        )
+        
         response.raise_for_status()
         
-        # Handle both JSON and text responses
-        try:
-            return response.json()
-        except ValueError:
-            return {"text_response": response.text, "status_code": response.status_code}
+        # Handle both JSON and text responses; empty bodies (e.g. 204 from stop/delete)
+        # are answered without raising and catching a decode error
+        content = response.content
+        if content:
+            try:
+                return _json_loads(content)
+            except ValueError:
+                pass
+        return {"text_response": response.text, "status_code": response.status_code}
             
     except requests.exceptions.RequestException as e:
         return {
@@ -896,20 +1050,36 @@ def _make_api_request(method: str, endpoint: str, headers: Dict[str, str], data:
     except Exception as e:
         return {"error": f"Unexpected error: {e}"}
 
+async def _amake_api_request(method: str, endpoint: str, headers: Dict[str, str], **kwargs) -> Dict[str, Any]:
+    """
+    Async variant of _make_api_request for use inside async tools.
+    Runs the blocking request in a worker thread so the event loop can keep serving other calls.
+    """
+    return await asyncio.to_thread(_make_api_request, method, endpoint, headers, **kwargs)
+
+# A standalone 404 status in an exception message (not part of a longer number such as an ID)
+_HTTP_404_RE = re.compile(r"\b404\b")
+
+# Result types that json.dumps always accepts (bool is an int subclass)
+_JSON_SCALAR_TYPES = (str, int, float)
+
 def _safe_execute(func, description: str, *args, **kwargs) -> Dict[str, Any]:
     """Safely execute a function and return standardized result with proper serialization"""
     try:
         result = func(*args, **kwargs)
         
-        # Ensure result is JSON serializable
-        try:
-            import json
-            # Test if result can be serialized
-            json.dumps(result)
+        # Ensure result is JSON serializable; scalars always are, so only containers
+        # (and arbitrary SDK objects) need the serialization probe
+        if result is None or isinstance(result, _JSON_SCALAR_TYPES):
             serializable_result = result
-        except (TypeError, ValueError):
-            # If result is not serializable, convert to string
-            serializable_result = str(result)
+        else:
+            try:
+                # Test if result can be serialized
+                json.dumps(result)
+                serializable_result = result
+            except (TypeError, ValueError):
+                # If result is not serializable, convert to string
+                serializable_result = str(result)
         
         return {
             "status": "PASSED",
@@ -920,14 +1090,15 @@ def _safe_execute(func, description: str, *args, **kwargs) -> Dict[str, Any]:
         error_msg = str(e)
         
         # Handle common API errors with better messaging
-        if "404" in error_msg and "endpoint" in error_msg.lower():
+        is_not_found = _HTTP_404_RE.search(error_msg) is not None
+        if is_not_found and "endpoint" in error_msg.lower():
             return {
                 "status": "WARNING", 
                 "error": f"API endpoint not available: {error_msg}",
                 "description": f"{description} (endpoint may not exist in this Domino version)",
                 "guidance": "This feature may not be available in your Domino instance or requires different permissions"
             }
-        elif "404" in error_msg:
+        elif is_not_found:
             return {
                 "status": "WARNING", 
                 "error": f"Resource not found: {error_msg}",
@@ -946,8 +1117,9 @@ def _safe_execute_optional_method(domino_client, method_name: str, description:
     Safely execute a domino client method that may not be available in all versions
     """
     try:
-        if hasattr(domino_client, method_name):
-            method = getattr(domino_client, method_name)
+        # Single attribute lookup; None means the method is not available in this version
+        method = getattr(domino_client, method_name, None)
+        if method is not None:
             return _safe_execute(method, description, *args, **kwargs)
         else:
             return {
@@ -964,20 +1136,25 @@ def _safe_execute_optional_method(domino_client, method_name: str, description:
             "description": description
         }
 
+def _compact(obj: Any, max_kb: int = 4) -> Any:
+    """
+    Bounds the size of a raw API payload embedded in a test report.
+    Small payloads are returned unchanged; larger ones are replaced by their serialized
+    size and a short preview so aggregating suites do not retain the full blob.
+    """
+    serialized = json.dumps(obj, default=str)
+    if len(serialized) <= max_kb * 1024:
+        return obj
+    return {"_truncated": True, "size": len(serialized), "preview": serialized[:512]}
+
 async def _test_file_api_fallback(operation: str, user_name: str, project_name: str, **kwargs) -> Dict[str, Any]:
     """
     Fallback file operations using actual Swagger API endpoints.
     Uses the documented API endpoints from swagger.json for reliable file operations.
     """
-    import os
-    import tempfile
-    import requests
     
     try:
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
         if operation == "list_files":
             # Use the documented browseFiles endpoint from Swagger
@@ -989,7 +1166,7 @@ async def _test_file_api_fallback(operation: str, user_name: str, project_name:
                 "filePath": "/"
             }
             
-            result = _make_api_request("GET", endpoint, headers, params=params)
+            result = await _amake_api_request("GET", endpoint, headers, params=params)
             if "error" not in result:
                 return {
                     "status": "PASSED",
@@ -1005,13 +1182,13 @@ async def _test_file_api_fallback(operation: str, user_name: str, project_name:
                     project_id = project_id_result["project_id"]
                     # Try to get latest commit ID
                     commits_endpoint = f"{domino_host}/projects/{project_id}/commits"
-                    commits_result = _make_api_request("GET", commits_endpoint, headers)
+                    commits_result = await _amake_api_request("GET", commits_endpoint, headers)
                     
                     if "error" not in commits_result and commits_result:
                         # Use first/latest commit
                         commit_id = commits_result[0].get("id") if isinstance(commits_result, list) else "head"
                         files_endpoint = f"{domino_host}/projects/{project_id}/commits/{commit_id}/files/"
-                        files_result = _make_api_request("GET", files_endpoint, headers)
+                        files_result = await _amake_api_request("GET", files_endpoint, headers)
                         
                         if "error" not in files_result:
                             return {
@@ -1043,41 +1220,35 @@ async def _test_file_api_fallback(operation: str, user_name: str, project_name:
                 # POST /projects/{projectId}/commits/head/files/{path} with multipart/form-data
                 upload_endpoint = f"{domino_host}/projects/{project_id}/commits/head/files/{filename}"
                 
-                # Create multipart form data
-                with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-                    temp_file.write(content)
-                    temp_file_path = temp_file.name
+                # Multipart upload through the pooled session, streamed from memory;
+                # requests sets the boundary Content-Type
+                upload_headers = {
+                    "X-Domino-Api-Key": domino_api_key
+                }
+                files = {'upfile': (filename, io.BytesIO(content.encode("utf-8")), 'text/plain')}
+                response = await asyncio.to_thread(_SESSION.post, upload_endpoint, headers=upload_headers, files=files)
                 
-                try:
-                    # Use requests directly for multipart upload
-                    upload_headers = {
-                        "X-Domino-Api-Key": domino_api_key
+                if response.status_code in [200, 201]:
+                    # Decode the body once; an empty or non-JSON body still means success
+                    try:
+                        upload_result = _json_loads(response.content)
+                    except ValueError:
+                        upload_result = {"message": "Upload successful"}
+                    return {
+                        "status": "PASSED",
+                        "result": upload_result,
+                        "description": f"Upload file via Swagger endpoint",
+                        "swagger_endpoint": upload_endpoint,
+                        "filename": filename,
+                        "project_id": project_id
+                    }
+                else:
+                    return {
+                        "status": "WARNING",
+                        "error": f"Upload failed with status {response.status_code}: {response.text}",
+                        "description": "File upload via Swagger endpoint",
+                        "swagger_endpoint": upload_endpoint
                     }
-                    
-                    with open(temp_file_path, 'rb') as f:
-                        files = {'upfile': (filename, f, 'text/plain')}
-                        response = requests.post(upload_endpoint, headers=upload_headers, files=files)
-                    
-                    if response.status_code in [200, 201]:
-                        return {
-                            "status": "PASSED",
-                            "result": response.json() if response.content else {"message": "Upload successful"},
-                            "description": f"Upload file via Swagger endpoint",
-                            "swagger_endpoint": upload_endpoint,
-                            "filename": filename,
-                            "project_id": project_id
-                        }
-                    else:
-                        return {
-                            "status": "WARNING",
-                            "error": f"Upload failed with status {response.status_code}: {response.text}",
-                            "description": "File upload via Swagger endpoint",
-                            "swagger_endpoint": upload_endpoint
-                        }
-                        
-                finally:
-                    if os.path.exists(temp_file_path):
-                        os.unlink(temp_file_path)
             else:
                 return {
                     "status": "SIMULATED_SUCCESS",
@@ -1099,40 +1270,60 @@ async def _test_file_api_fallback(operation: str, user_name: str, project_name:
             "description": f"Swagger file API fallback - {operation}"
         }
 
+@_ttl_cached(ttl=120)
+def _get_project_index() -> Dict[Tuple[str, str], str]:
+    """Map (owner username, project name) to project ID for every project listed by /v4/projects"""
+    result = _make_api_request("GET", f"{domino_host}/v4/projects", _AUTH_HEADERS)
+    if not isinstance(result, list):
+        return {}
+    return {
+        (_project_owner_username(project), project.get("name")): project.get("id")
+        for project in result
+        if isinstance(project, dict) and project.get("id")
+    }
+
 async def _get_project_id_from_swagger(user_name: str, project_name: str) -> Dict[str, Any]:
     """
     Get project ID using Swagger API endpoints.
     This is needed for many project-specific API calls.
     """
     try:
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
+        
+        # The canonical /v4/projects listing is tried first and indexed, so repeat lookups are free
+        project_index = await asyncio.to_thread(_get_project_index)
+        project_id = project_index.get((user_name, project_name))
+        if project_id:
+            return {
+                "status": "PASSED",
+                "project_id": project_id,
+                "description": f"Found project via {domino_host}/v4/projects"
+            }
         
-        # Try to search for projects by name
-        # This might require different endpoints depending on Domino version
-        search_endpoints = [
+        # Older Domino versions expose other search endpoints; they are only worth trying
+        # when /v4/projects gave no listing at all
+        search_endpoints = [] if project_index else [
             f"{domino_host}/projects/search",
             f"{domino_host}/projects",
             f"{domino_host}/v1/projects"
         ]
         
         for endpoint in search_endpoints:
-            try:
-                result = _make_api_request("GET", endpoint, headers)
-                if "error" not in result and isinstance(result, list):
-                    # Look for matching project
-                    for project in result:
-                        if (project.get("name") == project_name and 
-                            project.get("ownerUsername") == user_name):
-                            return {
-                                "status": "PASSED",
-                                "project_id": project.get("id"),
-                                "description": f"Found project via {endpoint}"
-                            }
-            except:
-                continue
+            result = await _amake_api_request("GET", endpoint, headers)
+            if isinstance(result, list):
+                # Look for matching project
+                for project in result:
+                    if (isinstance(project, dict) and project.get("name") == project_name and 
+                        project.get("ownerUsername") == user_name):
+                        return {
+                            "status": "PASSED",
+                            "project_id": project.get("id"),
+                            "description": f"Found project via {endpoint}"
+                        }
+                break
+            # Move on to the next endpoint only when this one does not exist
+            if result.get("status_code") != 404:
+                break
         
         # If search fails, try to construct project path and see if it exists
         # Some endpoints might accept owner/projectname format
@@ -1151,24 +1342,31 @@ async def _get_project_id_from_swagger(user_name: str, project_name: str) -> Dic
             "description": "Project ID lookup via Swagger API"
         }
 
+# KEY = "value" lines of the settings markdown (lines starting with # are headings/comments);
+# the key stops at the first "=" and surrounding whitespace is dropped from both sides
+_SETTINGS_LINE_RE = re.compile(r'^(?!#)[^\S\n]*([^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
+# Parsed settings keyed by file modification time, so unchanged files are not re-read
+_SETTINGS_CACHE: Dict[str, Any] = {"mtime_ns": None, "data": None}
+
 def _load_test_settings() -> Dict[str, str]:
     """Load test settings from domino-qa/domino_project_settings.md"""
     try:
         settings_path = Path("domino-qa/domino_project_settings.md")
-        if not settings_path.exists():
+        try:
+            mtime_ns = settings_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return {"error": "domino_project_settings.md not found in domino-qa/ folder"}
         
-        settings = {}
-        with open(settings_path, 'r') as f:
-            content = f.read()
-            
-        # Parse markdown settings
-        for line in content.split('\n'):
-            if '=' in line and not line.startswith('#'):
-                key, value = line.split('=', 1)
-                settings[key.strip()] = value.strip().strip('"')
+        if _SETTINGS_CACHE["mtime_ns"] != mtime_ns:
+            content = settings_path.read_text()
+            # Parse markdown settings
+            _SETTINGS_CACHE["data"] = {
+                match.group(1): match.group(2).strip('"')
+                for match in _SETTINGS_LINE_RE.finditer(content)
+            }
+            _SETTINGS_CACHE["mtime_ns"] = mtime_ns
                 
-        return settings
+        return dict(_SETTINGS_CACHE["data"])
     except Exception as e:
         return {"error": f"Failed to load test settings: {e}"}
 
@@ -1188,15 +1386,11 @@ async def create_domino_project(user_name: str, project_name: str, description:
     """
     
     try:
-        import requests
         
         # Construct the API URL for project creation
         api_url = f"{domino_host}/v4/projects"
         
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
         # Project creation payload - based on Domino v4 API requirements
         payload = {
@@ -1209,9 +1403,11 @@ async def create_domino_project(user_name: str, project_name: str, description:
         }
         
         print(f"🔨 Creating project: {user_name}/{project_name}")
-        response = requests.post(api_url, headers=headers, json=payload)
+        response = await asyncio.to_thread(_SESSION.post, api_url, headers=headers, json=payload)
         
         if response.status_code == 201:
+            _ttl_cache_invalidate("_get_project_id", (user_name, project_name))
+            _ttl_cache_invalidate("_get_project_index", ())
             project_data = response.json()
             return {
                 "status": "CREATED",
@@ -1242,6 +1438,18 @@ async def create_domino_project(user_name: str, project_name: str, description:
             "message": f"Exception while creating project {user_name}/{project_name}"
         }
 
+@_ttl_cached(ttl=60)
+def _check_project_access(user_name: str, project_name: str) -> Dict[str, Any]:
+    """
+    Probes a project by listing its runs. Only successful probes are cached, so a suite that
+    checks the same project before every test makes one round trip instead of one per test.
+    """
+    domino = _create_domino_client(user_name, project_name)
+    runs_result = _safe_execute(domino.runs_list, "Check project existence")
+    if runs_result["status"] == "PASSED":
+        return {"status": "PASSED"}
+    return {"status": runs_result["status"], "error": runs_result.get("error", "Project not accessible")}
+
 async def ensure_project_exists(user_name: str, project_name: str) -> Dict[str, Any]:
     """
     Ensures a project exists, creating it if necessary.
@@ -1256,8 +1464,7 @@ async def ensure_project_exists(user_name: str, project_name: str) -> Dict[str,
     
     try:
         # First, try to connect to the project to see if it exists
-        domino = _create_domino_client(user_name, project_name)
-        runs_result = _safe_execute(domino.runs_list, "Check project existence")
+        runs_result = await asyncio.to_thread(_check_project_access, user_name, project_name)
         
         if runs_result["status"] == "PASSED":
             return {
@@ -1318,11 +1525,13 @@ async def create_project_if_needed(user_name: str, project_name: str, descriptio
             create_result = await create_domino_project(user_name, project_name, description)
             
             if create_result["status"] == "CREATED":
-                # Wait for project initialization
-                await asyncio.sleep(3)
-                
-                # Verify project was created successfully
-                verify_result = await ensure_project_exists(user_name, project_name)
+                # Verify project was created successfully, polling briefly while it initializes
+                # rather than always sleeping for the full initialization window
+                for attempt in range(6):
+                    verify_result = await ensure_project_exists(user_name, project_name)
+                    if verify_result["status"] == "EXISTS" or attempt == 5:
+                        break
+                    await asyncio.sleep(0.5)
                 if verify_result["status"] == "EXISTS":
                     return {
                         "status": "CREATED",
@@ -1383,8 +1592,8 @@ async def test_user_authentication(user_name: str, project_name: str) -> Dict[st
         
         if project_status["status"] in ["EXISTS", "CREATED", "CREATED_UNVERIFIED"]:
             # Now test authentication with the existing/created project
-            domino = _create_domino_client(user_name, project_name)
-            runs_result = _safe_execute(domino.runs_list, "List user project runs")
+            domino = await asyncio.to_thread(_create_domino_client, user_name, project_name)
+            runs_result = await asyncio.to_thread(_safe_execute, domino.runs_list, "List user project runs")
             
             if runs_result["status"] == "PASSED":
                 runs_data = runs_result.get("result", [])
@@ -1430,6 +1639,12 @@ async def test_user_authentication(user_name: str, project_name: str) -> Dict[st
 # REMOVED: test_project_operations - only listed runs/datasets, didn't test 2.2 requirements
 # Use specific functions instead: test_file_management_operations, test_project_copying, test_project_forking
 
+# Per-language smoke-test commands for test_job_execution, built once at import
+_JOB_CMDS = MappingProxyType({
+    "python": ("python", "-c", "print('UAT Test: Python execution successful'); import sys; print(f'Python version: {sys.version}')"),
+    "r": ("Rscript", "-e", "cat('UAT Test: R execution successful\\n'); cat('R version:', R.version.string, '\\n')"),
+})
+
 async def test_job_execution(user_name: str, project_name: str, language: str = "python") -> Dict[str, Any]:
     """
     Tests job execution capabilities with Python or R code.
@@ -1458,11 +1673,9 @@ async def test_job_execution(user_name: str, project_name: str, language: str =
             domino = _create_domino_client(user_name, project_name)
             
             # Define test commands
-            if language.lower() == "python":
-                command = ["python", "-c", "print('UAT Test: Python execution successful'); import sys; print(f'Python version: {sys.version}')"]
-            elif language.lower() == "r":
-                command = ["Rscript", "-e", "cat('UAT Test: R execution successful\\n'); cat('R version:', R.version.string, '\\n')"]
-            else:
+            try:
+                command = list(_JOB_CMDS[language.lower()])
+            except KeyError:
                 raise ValueError(f"Unsupported language: {language}")
             
             # Start the job
@@ -1480,8 +1693,8 @@ async def test_job_execution(user_name: str, project_name: str, language: str =
             test_results.update({
                 "status": "PASSED",
                 "run_id": run_id,
-                "job_result": job_result,
-                "status_check": status_result,
+                "job_result": _compact(job_result),
+                "status_check": _compact(status_result),
                 "message": f"Successfully started {language} job with ID: {run_id}"
             })
             
@@ -1526,16 +1739,13 @@ async def test_workspace_operations(user_name: str, project_name: str) -> Dict[s
         
         if project_status["status"] in ["EXISTS", "READY"]:
             # Test workspace operations using correct Swagger API endpoints
-            domino = _create_domino_client(user_name, project_name)
-            headers = {
-                "X-Domino-Api-Key": domino_api_key,
-                "Content-Type": "application/json"
-            }
+            domino = await asyncio.to_thread(_create_domino_client, user_name, project_name)
+            headers = _AUTH_HEADERS
             
             operations = {}
             
             # Step 1: Get the actual numeric project ID
-            project_id = _get_project_id(user_name, project_name, headers)
+            project_id = await asyncio.to_thread(_get_project_id, user_name, project_name, headers)
             
             if not project_id:
                 test_results.update({
@@ -1549,52 +1759,65 @@ async def test_workspace_operations(user_name: str, project_name: str) -> Dict[s
             print(f"✅ Found project ID: {project_id} for {user_name}/{project_name}")
             test_results["project_id"] = project_id
             
+            # Listing is independent of the create -> start -> stop -> delete chain, so it runs
+            # alongside the chain; each blocking helper runs in a worker thread
+            list_task = asyncio.create_task(asyncio.to_thread(_test_list_workspaces, headers, project_id))
+            try:
+                workspace_create_result = await asyncio.to_thread(_test_create_workspace, headers, project_id)
+                workspace_start_result = await asyncio.to_thread(_test_start_workspace_session, headers, project_id, workspace_create_result)
+                workspace_stop_result = await asyncio.to_thread(_test_stop_workspace_session, headers, project_id, workspace_start_result)
+                workspace_delete_result = await asyncio.to_thread(_test_delete_workspace, headers, project_id, workspace_create_result)
+                workspace_list_result = await list_task
+            finally:
+                # If the chain raised, the listing is cancelled and still awaited so it never leaks
+                if not list_task.done():
+                    list_task.cancel()
+                await asyncio.gather(list_task, return_exceptions=True)
+            
             # Test 1: List existing workspaces
-            workspace_list_result = _test_list_workspaces(headers, project_id)
             operations["list_workspaces"] = {
                 "status": "PASSED" if workspace_list_result.get("success") else "WARNING",
-                "result": workspace_list_result,
+                "result": _compact(workspace_list_result),
                 "description": "List project workspaces"
             }
             
             # Test 2: Create a new workspace
-            workspace_create_result = _test_create_workspace(headers, project_id)
             operations["create_workspace"] = {
                 "status": "PASSED" if workspace_create_result.get("success") else "WARNING",
-                "result": workspace_create_result,
+                "result": _compact(workspace_create_result),
                 "description": "Create new workspace"
             }
             
             # Test 3: Start workspace session (if workspace was created)
-            workspace_start_result = _test_start_workspace_session(headers, project_id, workspace_create_result)
             operations["start_workspace_session"] = {
                 "status": "PASSED" if workspace_start_result.get("success") else "WARNING",
-                "result": workspace_start_result,
+                "result": _compact(workspace_start_result),
                 "description": "Start workspace session"
             }
             
             # Test 4: Stop workspace session (if session was started)
-            workspace_stop_result = _test_stop_workspace_session(headers, project_id, workspace_start_result)
             operations["stop_workspace_session"] = {
                 "status": "PASSED" if workspace_stop_result.get("success") else "WARNING",
-                "result": workspace_stop_result,
+                "result": _compact(workspace_stop_result),
                 "description": "Stop workspace session"
             }
             
             # Test 5: Delete workspace (cleanup)
-            workspace_delete_result = _test_delete_workspace(headers, project_id, workspace_create_result)
             operations["delete_workspace"] = {
                 "status": "PASSED" if workspace_delete_result.get("success") else "WARNING",
-                "result": workspace_delete_result,
+                "result": _compact(workspace_delete_result),
                 "description": "Delete workspace (cleanup)"
             }
             
             test_results["operations"] = operations
             
-            # Determine overall status
-            failed_ops = [k for k, v in operations.items() if v["status"] == "FAILED"]
-            warning_ops = [k for k, v in operations.items() if v["status"] == "WARNING"]
-            passed_ops = [k for k, v in operations.items() if v["status"] == "PASSED"]
+            # Determine overall status, bucketing operations in a single pass
+            failed_ops, warning_ops, passed_ops = [], [], []
+            status_buckets = {"FAILED": failed_ops, "WARNING": warning_ops, "PASSED": passed_ops}
+            for op_name, op in operations.items():
+                bucket = status_buckets.get(op["status"])
+                if bucket is not None:
+                    bucket.append(op_name)
             
             if failed_ops:
                 test_results["status"] = "FAILED"
@@ -1635,6 +1858,70 @@ async def test_workspace_operations(user_name: str, project_name: str) -> Dict[s
 
 # Performance Test Functions
 
+# Upper bound on concurrent SDK submissions from a single performance tool
+_PERF_QUEUE_WORKERS = 16
+
+def _latency_percentiles(samples, scale: float = 1.0) -> Dict[str, float]:
+    """
+    Summarizes latency samples as p50/p95/p99 using the stdlib quantile estimator.
+    
+    Args:
+        samples: Sequence of latency samples (list or array)
+        scale (float): Divisor applied to each percentile, e.g. 1e9 for nanosecond samples
+    """
+    if len(samples) < 2:
+        value = samples[0] / scale if samples else 0
+        return {"p50": value, "p95": value, "p99": value}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49] / scale, "p95": cuts[94] / scale, "p99": cuts[98] / scale}
+
+async def _run_in_queue(func, params: List[tuple], num_workers: int) -> List[Any]:
+    """
+    Runs func(*param) for every entry in params using at most num_workers concurrent calls.
+    Workers pull from a shared queue and hand each blocking call to one thread pool shared by
+    all of them and sized to the worker count, so a large fan-out never has more than
+    num_workers SDK requests in flight.
+    Results (or the raised exception) are returned in input order.
+    """
+    results: List[Any] = [None] * len(params)
+    if not params:
+        return results
+    
+    # A single call (the usual smoke-test count) needs no queue, workers or dedicated pool
+    if len(params) == 1:
+        try:
+            results[0] = await asyncio.to_thread(func, *params[0])
+        except Exception as e:
+            results[0] = e
+        return results
+    
+    queue = asyncio.Queue()
+    for index, param in enumerate(params):
+        queue.put_nowait((index, param))
+    
+    loop = asyncio.get_running_loop()
+    num_workers = max(1, min(num_workers, len(params)))
+    
+    async def worker(executor):
+        while True:
+            index, param = await queue.get()
+            try:
+                results[index] = await loop.run_in_executor(executor, func, *param)
+            except Exception as e:
+                results[index] = e
+            finally:
+                queue.task_done()
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+        workers = [asyncio.create_task(worker(executor)) for _ in range(num_workers)]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+    return results
+
 async def performance_test_workspaces(user_name: str, project_name: str, concurrent_count: int = 10) -> Dict[str, Any]:
     """
     STANDALONE PERFORMANCE TEST: Launch multiple workspaces simultaneously to test system capacity.
@@ -1650,33 +1937,39 @@ async def performance_test_workspaces(user_name: str, project_name: str, concurr
         - Medium test: concurrent_count=25
         - Large test: concurrent_count=50
     """
-    encoded_user_name = _validate_url_parameter(user_name, "user_name")
-    encoded_project_name = _validate_url_parameter(project_name, "project_name")
+    # No REST URLs are built here: the python-domino client handles the user/project path,
+    # so the names are not URL-validated or encoded up front
     
-    headers = {
-        "X-Domino-Api-Key": domino_api_key,
-        "Content-Type": "application/json"
+    # Everything except the workspace name is identical across launches, so the client,
+    # tier and request template are built once instead of once per launch
+    try:
+        # Try using the Domino python client instead of direct API calls
+        await asyncio.to_thread(_create_domino_client, user_name, project_name)
+        client_error = None
+    except Exception as e:
+        client_error = str(e)
+    workspace_template = {
+        "type": "workspace_test",
+        "tier": await asyncio.to_thread(_validate_hardware_tier, "small")
     }
     
     def start_workspace(workspace_index):
+        # Wall-clock stamps are reported to the caller; the duration uses the monotonic clock
         start_time = time.time()  # Moved to beginning
+        started = time.perf_counter()
         try:
-            # Try using the Domino python client instead of direct API calls
-            domino = _create_domino_client(user_name, project_name)
+            if client_error is not None:
+                raise RuntimeError(client_error)
             # Instead of direct API calls, try to use a simple job creation as a proxy for workspace testing
             # This provides similar functionality while avoiding API endpoint issues
-            start_data = {
-                "type": "workspace_test",
-                "name": f"Performance Test Workspace {workspace_index}",
-                "tier": _validate_hardware_tier("small")
-            }
+            start_data = {**workspace_template, "name": f"Performance Test Workspace {workspace_index}"}
             
             # For now, simulate workspace creation with a simple test
             result = {
                 "workspace_index": workspace_index,
                 "status": "SIMULATED",
                 "message": "Workspace API endpoint unavailable, using simulation",
-                "data": start_data
+                "workspace_name": start_data["name"]
             }
             
             end_time = time.time()
@@ -1684,7 +1977,7 @@ async def performance_test_workspaces(user_name: str, project_name: str, concurr
                 "workspace_index": workspace_index,
                 "start_time": start_time,
                 "end_time": end_time,
-                "duration": end_time - start_time,
+                "duration": time.perf_counter() - started,
                 "result": result,
                 "status": result.get("status", "FAILED")
             }
@@ -1695,7 +1988,7 @@ async def performance_test_workspaces(user_name: str, project_name: str, concurr
                 "workspace_index": workspace_index,
                 "start_time": start_time,
                 "end_time": end_time,
-                "duration": end_time - start_time,
+                "duration": time.perf_counter() - started,
                 "result": {
                     "error": str(e),
                     "message": "Workspace creation failed"
@@ -1703,20 +1996,29 @@ async def performance_test_workspaces(user_name: str, project_name: str, concurr
                 "status": "FAILED"
             }
     
-    # Launch workspaces concurrently
-    start_time = time.time()
+    # Launch workspaces concurrently without blocking the event loop while they run
+    loop = asyncio.get_running_loop()
+    start_time = time.perf_counter()
     
     with concurrent.futures.ThreadPoolExecutor(max_workers=concurrent_count) as executor:
-        futures = [executor.submit(start_workspace, i) for i in range(concurrent_count)]
-        results = [future.result() for future in concurrent.futures.as_completed(futures)]
-    
-    end_time = time.time()
+        launches = [loop.run_in_executor(executor, start_workspace, i) for i in range(concurrent_count)]
+        
+        # Fold each launch into running totals as it completes rather than re-scanning all results
+        results = []
+        successful_launches = failed_launches = 0
+        successful_durations = array("d")
+        for launch in asyncio.as_completed(launches):
+            r = await launch
+            results.append(r)
+            if r["status"] in ("SUCCESS", "SIMULATED"):
+                successful_launches += 1
+                successful_durations.append(r["duration"])
+            elif r["status"] == "FAILED":
+                failed_launches += 1
     
-    # Analyze results
-    successful_launches = [r for r in results if r["status"] in ["SUCCESS", "SIMULATED"]]
-    failed_launches = [r for r in results if r["status"] == "FAILED"]
+    end_time = time.perf_counter()
     
-    avg_duration = sum(r["duration"] for r in successful_launches) / len(successful_launches) if successful_launches else 0
+    avg_duration = sum(successful_durations) / successful_launches if successful_launches else 0
     
     return {
         "test": "performance_test_workspaces",
@@ -1724,12 +2026,14 @@ async def performance_test_workspaces(user_name: str, project_name: str, concurr
         "project_name": project_name,
         "concurrent_count": concurrent_count,
         "total_duration": end_time - start_time,
-        "successful_launches": len(successful_launches),
-        "failed_launches": len(failed_launches),
-        "success_rate": len(successful_launches) / concurrent_count * 100,
+        "successful_launches": successful_launches,
+        "failed_launches": failed_launches,
+        "success_rate": successful_launches / concurrent_count * 100,
         "average_launch_duration": avg_duration,
+        "launch_duration_percentiles": _latency_percentiles(successful_durations),
+        "workspace_template": workspace_template,
         "results": results,
-        "status": "PASSED" if len(successful_launches) >= concurrent_count * 0.8 else "FAILED",  # 80% success rate threshold
+        "status": "PASSED" if successful_launches >= concurrent_count * 0.8 else "FAILED",  # 80% success rate threshold
         "timestamp": datetime.datetime.now().isoformat()
     }
 
@@ -1749,63 +2053,104 @@ async def stress_test_api(concurrent_requests: int = 100, test_duration: int = 6
         - Medium test: concurrent_requests=500, test_duration=180
         - Large test: concurrent_requests=1000, test_duration=300
     """
-    headers = {
-        "X-Domino-Api-Key": domino_api_key,
-        "Content-Type": "application/json"
-    }
+    headers = _AUTH_HEADERS
     
     request_count = 0
     successful_requests = 0
     failed_requests = 0
-    response_times = []
+    # Latencies are kept as perf_counter_ns deltas in a typed array: 8 bytes per sample
+    # instead of a boxed float, which matters at 1000 workers over several minutes
+    response_times = array("q")
+    # Only the first 10 error messages are reported, so only those are kept; everything
+    # else is tallied by (truncated) message so long runs stay O(distinct errors)
     errors = []
+    error_counts = Counter()
+    
+    # Requests are driven from the event loop: each one runs on a dedicated pool thread while a
+    # semaphore keeps exactly concurrent_requests of them in flight. Counters are only updated
+    # back on the loop thread, so they need no locking.
+    loop = asyncio.get_running_loop()
+    in_flight = asyncio.Semaphore(concurrent_requests)
+    url = f"{domino_host}/api/users/v1/self"
+    
+    # The probe is the same GET every time, so it is prepared once and workers only send it.
+    # Only the status matters, so the body is never parsed.
+    prepared = _STRESS_SESSION.prepare_request(requests.Request("GET", url, headers=headers))
+    send_kwargs = _STRESS_SESSION.merge_environment_settings(prepared.url, {}, None, None, None)
+    
+    def probe() -> Optional[str]:
+        """Sends the prepared probe without retries, returning an error message or None on success"""
+        try:
+            _STRESS_SESSION.send(prepared, timeout=60, **send_kwargs).raise_for_status()
+            return None
+        except requests.exceptions.RequestException as e:
+            return f"API request failed: {e}"
+        except Exception as e:
+            return f"Unexpected error: {e}"
     
-    def make_request():
-        nonlocal request_count, successful_requests, failed_requests, response_times, errors
+    async def make_request(executor):
+        nonlocal request_count, successful_requests, failed_requests
         
-        request_count += 1
-        start_time = time.time()
-        
-        # Simple GET request to a valid API endpoint (user info)
-        result = _make_api_request("GET", f"{domino_host}/api/users/v1/self", headers)
-        
-        end_time = time.time()
-        duration = end_time - start_time
-        response_times.append(duration)
-        
-        if "error" in result:
-            failed_requests += 1
-            errors.append(result["error"])
-        else:
-            successful_requests += 1
+        try:
+            start_ns = time.perf_counter_ns()
+            
+            # Simple GET request to a valid API endpoint (user info)
+            error = await loop.run_in_executor(executor, probe)
+            
+            # Only completed requests are counted; ones cancelled at the deadline are not
+            request_count += 1
+            response_times.append(time.perf_counter_ns() - start_ns)
+            
+            if error is not None:
+                failed_requests += 1
+                error_counts[error[:64]] += 1
+                if len(errors) < 10:
+                    errors.append(error)
+            else:
+                successful_requests += 1
+        finally:
+            in_flight.release()
     
     # Run stress test
-    start_time = time.time()
+    start_time = time.perf_counter()
+    deadline = start_time + test_duration
+    cancelled_requests = 0
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrent_requests) as executor:
-        futures = []
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrent_requests)
+    try:
+        tasks = set()
         
-        while time.time() - start_time < test_duration:
-            for _ in range(min(concurrent_requests, 10)):  # Batch requests
-                futures.append(executor.submit(make_request))
-            
-            # Wait a bit to avoid overwhelming
-            time.sleep(0.1)
-            
-            # Clean up completed futures
-            completed_futures = [f for f in futures if f.done()]
-            for f in completed_futures:
-                futures.remove(f)
-    
-    # Wait for remaining futures to complete
-    for future in futures:
-        future.result()
+        while time.perf_counter() < deadline:
+            # Wait for a free slot instead of sleeping and rescanning finished futures,
+            # but never past the deadline. asyncio.timeout cancels the acquire in place, so a
+            # timeout racing a successful acquire cannot leak a permit the way wait_for can.
+            try:
+                async with asyncio.timeout(deadline - time.perf_counter()):
+                    await in_flight.acquire()
+            except TimeoutError:
+                break
+            task = asyncio.create_task(make_request(executor))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        
+        # Stragglers still in flight at the deadline are cancelled so a slow endpoint cannot
+        # stretch the measured duration past test_duration
+        if tasks:
+            _, pending = await asyncio.wait(set(tasks), timeout=max(0, deadline - time.perf_counter()))
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            cancelled_requests = len(pending)
+        
+        end_time = time.perf_counter()
+    finally:
+        # Abandoned worker threads finish their in-flight HTTP call in the background
+        executor.shutdown(wait=False, cancel_futures=True)
     
-    end_time = time.time()
     actual_duration = end_time - start_time
     
-    # Calculate statistics
-    avg_response_time = sum(response_times) / len(response_times) if response_times else 0
+    # Calculate statistics (reported in seconds)
+    avg_response_time = sum(response_times) / len(response_times) / 1e9 if response_times else 0
     requests_per_second = request_count / actual_duration if actual_duration > 0 else 0
     
     return {
@@ -1815,13 +2160,16 @@ async def stress_test_api(concurrent_requests: int = 100, test_duration: int = 6
         "total_requests": request_count,
         "successful_requests": successful_requests,
         "failed_requests": failed_requests,
+        "cancelled_requests": cancelled_requests,
         "success_rate": successful_requests / request_count * 100 if request_count > 0 else 0,
         "requests_per_second": requests_per_second,
         "average_response_time": avg_response_time,
-        "min_response_time": min(response_times) if response_times else 0,
-        "max_response_time": max(response_times) if response_times else 0,
-        "error_samples": errors[:10],  # First 10 errors
-        "status": "PASSED" if successful_requests / request_count > 0.95 else "FAILED",  # 95% success rate threshold
+        "min_response_time": min(response_times) / 1e9 if response_times else 0,
+        "max_response_time": max(response_times) / 1e9 if response_times else 0,
+        "response_time_percentiles": _latency_percentiles(response_times, scale=1e9),
+        "error_samples": errors,  # First 10 errors
+        "error_counts": dict(error_counts.most_common(10)),
+        "status": "PASSED" if request_count and successful_requests / request_count > 0.95 else "FAILED",  # 95% success rate threshold
         "timestamp": datetime.datetime.now().isoformat()
     }
 
@@ -1829,8 +2177,44 @@ async def stress_test_api(concurrent_requests: int = 100, test_duration: int = 6
 # PERFORMANCE TESTING FUNCTIONS
 # ========================================================================
 
+# Loop body run once per second of job_duration by performance_test_concurrent_jobs jobs.
+# The snippets are embedded in a double-quoted `python -c` argument, so they use single quotes only.
+_JOB_WORKLOADS = MappingProxyType({
+    "sleep": "    time.sleep(1)",
+    "cpu": (
+        "    step_end = time.time() + 1\n"
+        "    while time.time() < step_end:\n"
+        "        sum(k * k for k in range(10000))"
+    ),
+    "io": (
+        "    step_end = time.time() + 1\n"
+        "    while time.time() < step_end:\n"
+        "        with open('/tmp/perf_io_test.bin', 'wb') as f:\n"
+        "            f.write(os.urandom(1 << 20))\n"
+        "        with open('/tmp/perf_io_test.bin', 'rb') as f:\n"
+        "            f.read()"
+    ),
+})
+
+def _job_status_settled(status_result) -> bool:
+    """
+    True once a sampled job needs no more polling: its status call failed, or python-domino's
+    job_status payload ({"statuses": {"isCompleted", "executionStatus"}}) reports it finished.
+    """
+    if not isinstance(status_result, dict) or status_result.get("status") != "PASSED":
+        return True
+    statuses = (status_result.get("result") or {}).get("statuses") or {}
+    return bool(statuses.get("isCompleted")) or statuses.get("executionStatus") in _TERMINAL_RUN_STATES
+
+def _record_operation(test_results: Dict[str, Any], failed_ops: List[str], op_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Stores an operation result on test_results, noting its name in failed_ops when it failed"""
+    test_results["operations"][op_name] = result
+    if result.get("status") == "FAILED":
+        failed_ops.append(op_name)
+    return result
+
 @mcp.tool()
-async def performance_test_concurrent_jobs(user_name: str, project_name: str, concurrent_count: int = 5, job_duration: int = 10) -> Dict[str, Any]:
+async def performance_test_concurrent_jobs(user_name: str, project_name: str, concurrent_count: int = 5, job_duration: int = 10, status_sample_size: int = 3, workload: str = "sleep") -> Dict[str, Any]:
     """
     Performance test: Launch multiple jobs concurrently to test system capacity.
     Creates the project if it doesn't exist.
@@ -1840,6 +2224,8 @@ async def performance_test_concurrent_jobs(user_name: str, project_name: str, co
         project_name (str): The project name to launch jobs in
         concurrent_count (int): Number of jobs to launch concurrently
         job_duration (int): Duration in seconds for each job
+        status_sample_size (int): Number of launched jobs whose status is checked each round (default: 3)
+        workload (str): What each job does for job_duration seconds: "sleep" (default), "cpu" or "io"
     """
     
     test_results = {
@@ -1848,20 +2234,27 @@ async def performance_test_concurrent_jobs(user_name: str, project_name: str, co
         "project_name": project_name,
         "concurrent_count": concurrent_count,
         "job_duration": job_duration,
+        "workload": workload,
         "timestamp": datetime.datetime.now().isoformat(),
         "operations": {}
     }
+    # Failed operation names are collected as results are recorded, not by rescanning at the end
+    failed_ops = []
     
     try:
-        # Ensure project exists
-        project_status = await ensure_project_exists(user_name, project_name)
-        test_results["project_setup"] = project_status
+        try:
+            workload_step = _JOB_WORKLOADS[workload]
+        except KeyError:
+            raise ValueError(f"Unsupported workload: {workload} (expected one of {', '.join(_JOB_WORKLOADS)})")
         
-        if project_status["status"] in ["EXISTS", "CREATED", "CREATED_UNVERIFIED"]:
-            domino = _create_domino_client(user_name, project_name)
-            
-            # Create job commands
-            job_command = f"""python -c "
+        # The project check and the tier lookup are independent round trips, so both start
+        # now and the job command is built while they are in flight
+        project_task = asyncio.create_task(ensure_project_exists(user_name, project_name))
+        tier_task = asyncio.create_task(asyncio.to_thread(_validate_hardware_tier, "small"))
+        
+        # Create job commands
+        job_command = f"""python -c "
+import os
 import time
 import random
 import datetime
@@ -1872,31 +2265,36 @@ print('Job ID: {{job_id}}')
 # Simulate some work
 for i in range({job_duration}):
     print(f'Working... step {{i+1}}/{job_duration}')
-    time.sleep(1)
+{workload_step}
 
 print('Performance Test Job Completed at:', datetime.datetime.now().isoformat())
 "
 """
+        # Split once around the job id placeholder so each job's command is a plain join
+        job_command_head, job_command_tail = job_command.split("{job_id}")
+        
+        project_status, hardware_tier = await asyncio.gather(project_task, tier_task)
+        test_results["project_setup"] = project_status
+        
+        if project_status["status"] in ["EXISTS", "CREATED", "CREATED_UNVERIFIED"]:
+            domino = await asyncio.to_thread(_create_domino_client, user_name, project_name)
+            
+            # Hardware tier comes with fallback handling
+            if hardware_tier is None:
+                log.debug("Using default hardware tier")
             
             # Launch concurrent jobs
-            start_time = time.time()
-            job_results = []
+            start_time = time.perf_counter()
             
-            print(f"🚀 Launching {concurrent_count} concurrent jobs...")
+            log.info("Launching %d concurrent jobs...", concurrent_count)
             
-            # Start all jobs
-            for i in range(concurrent_count):
-                job_cmd = job_command.replace("{job_id}", f"perf-test-{i+1}")
-                
-                # Get hardware tier, with fallback handling
-                hardware_tier = _validate_hardware_tier("small")
-                if hardware_tier is None:
-                    print("DEBUG: Using default hardware tier")
-                
-                job_result = _safe_execute(
+            # Start all jobs through a bounded worker queue so large counts overlap without
+            # flooding the Domino API with one submit per job at once
+            launch_params = [
+                (
                     domino.job_start,
                     f"Start performance test job {i+1}",
-                    job_cmd,
+                    f"{job_command_head}perf-test-{i+1}{job_command_tail}",
                     None,  # commit_id
                     None,  # hardware_tier_id
                     hardware_tier,  # hardware_tier_name
@@ -1906,46 +2304,66 @@ print('Performance Test Job Completed at:', datetime.datetime.now().isoformat())
                     None,  # external_volume_mounts
                     f"Performance Test Job {i+1} - {datetime.datetime.now().strftime('%H:%M:%S')}"
                 )
-                job_results.append(job_result)
-                test_results["operations"][f"start_job_{i+1}"] = job_result
+                for i in range(concurrent_count)
+            ]
+            job_results = await _run_in_queue(_safe_execute, launch_params, _PERF_QUEUE_WORKERS)
+            
+            for i, job_result in enumerate(job_results):
+                if isinstance(job_result, BaseException):
+                    job_result = {"status": "FAILED", "error": str(job_result), "description": f"Start performance test job {i+1}"}
+                    job_results[i] = job_result
+                _record_operation(test_results, failed_ops, f"start_job_{i+1}", job_result)
             
             # Count successful starts
             successful_starts = sum(1 for result in job_results if result["status"] == "PASSED")
             job_ids = [result["result"].get("id") for result in job_results if result["status"] == "PASSED"]
             
-            test_results["operations"]["job_launch_summary"] = {
+            _record_operation(test_results, failed_ops, "job_launch_summary", {
                 "status": "PASSED" if successful_starts > 0 else "FAILED",
                 "description": "Job launch summary",
                 "result": {
                     "requested_jobs": concurrent_count,
                     "successful_starts": successful_starts,
                     "job_ids": job_ids,
-                    "launch_time_seconds": time.time() - start_time
+                    "launch_time_seconds": time.perf_counter() - start_time
                 }
-            }
+            })
             
             # Monitor job progress
             if job_ids:
-                print(f"📊 Monitoring {len(job_ids)} jobs...")
-                
-                # Wait and check status periodically
-                for check_round in range(3):
-                    await asyncio.sleep(5)
+                log.info("Monitoring %d jobs...", len(job_ids))
+                
+                # Poll with backoff scaled to the expected job duration, stopping as soon as every
+                # sampled job is terminal or after twice the expected duration
+                delay = 1.0
+                max_delay = max(delay, min(job_duration / 3, 30))
+                monitor_deadline = time.perf_counter() + 2 * job_duration
+                check_round = 0
+                while True:
+                    await asyncio.sleep(min(delay, max(0, monitor_deadline - time.perf_counter())))
+                    check_round += 1
                     
-                    status_results = []
-                    for job_id in job_ids[:3]:  # Check first 3 jobs
-                        status_result = _safe_execute(domino.job_status, f"Check job status {job_id}", job_id)
-                        status_results.append(status_result)
+                    # The SDK has no bulk status call, so the sampled jobs are checked concurrently
+                    status_results = await _run_in_queue(
+                        _safe_execute,
+                        [(domino.job_status, f"Check job status {job_id}", job_id) for job_id in job_ids[:status_sample_size]],
+                        _PERF_QUEUE_WORKERS
+                    )
                     
-                    test_results["operations"][f"status_check_round_{check_round+1}"] = {
+                    _record_operation(test_results, failed_ops, f"status_check_round_{check_round}", {
                         "status": "PASSED",
-                        "description": f"Status check round {check_round+1}",
+                        "description": f"Status check round {check_round}",
                         "result": status_results
-                    }
+                    })
+                    
+                    all_terminal = all(_job_status_settled(sr) for sr in status_results)
+                    if all_terminal or time.perf_counter() >= monitor_deadline:
+                        break
+                    delay = min(delay * 1.5, max_delay)
             
             # Final summary
-            end_time = time.time()
-            test_results["operations"]["performance_summary"] = {
+            end_time = time.perf_counter()
+            _record_operation(test_results, failed_ops, "performance_summary", {
                 "status": "PASSED",
                 "description": "Performance test summary",
                 "result": {
@@ -1953,10 +2371,9 @@ print('Performance Test Job Completed at:', datetime.datetime.now().isoformat())
                     "jobs_per_second": successful_starts / (end_time - start_time) if end_time > start_time else 0,
                     "success_rate": f"{(successful_starts/concurrent_count)*100:.1f}%" if concurrent_count > 0 else "0%"
                 }
-            }
+            })
             
             # Determine overall status
-            failed_ops = [k for k, v in test_results["operations"].items() if v["status"] == "FAILED"]
             test_results["status"] = "FAILED" if failed_ops else "PASSED"
             test_results["failed_operations"] = failed_ops
             
@@ -1988,8 +2405,44 @@ print('Performance Test Job Completed at:', datetime.datetime.now().isoformat())
         })
         return test_results
 
+# Bytes per MiB and its reciprocal, for sizing upload files and reporting throughput
+_MIB = 1024 * 1024
+_BYTES_TO_MIB = 1.0 / _MIB
+
+_UPLOAD_CSV_HEADER = b"id,value1,value2,description\n"
+
+@functools.lru_cache(maxsize=1)
+def _upload_test_block() -> bytes:
+    """Builds ~1 MiB of timestamp-free CSV rows once; upload test files are written as repeats of it"""
+    rows = []
+    size = 0
+    j = 0
+    while size < _MIB:
+        row = f"{j},{j*0.1:.1f},{j*0.2:.1f},test_data_row_{j}\n"
+        rows.append(row)
+        size += len(row)
+        j += 1
+    return "".join(rows).encode("ascii")
+
+def _write_upload_test_file(f, size_bytes: int) -> None:
+    """
+    Writes roughly size_bytes of CSV test data to a binary file object, one pre-built block
+    at a time, so generating a file costs a buffered write per MiB instead of per-row work.
+    Each file starts with a fresh generation timestamp, so no two runs upload identical bytes.
+    The file always ends on a complete row.
+    """
+    block = _upload_test_block()
+    header = f"# generated_at={datetime.datetime.now().isoformat()}\n".encode("ascii") + _UPLOAD_CSV_HEADER
+    f.write(header)
+    remaining = size_bytes - len(header)
+    while remaining >= len(block):
+        f.write(block)
+        remaining -= len(block)
+    if remaining > 0:
+        f.write(block[:block.rfind(b"\n", 0, remaining) + 1])
+
 @mcp.tool()
-async def performance_test_data_upload_throughput(user_name: str, project_name: str, file_size_mb: int = 10, file_count: int = 5) -> Dict[str, Any]:
+async def performance_test_data_upload_throughput(user_name: str, project_name: str, file_size_mb: int = 10, file_count: int = 5, concurrency: int = 1) -> Dict[str, Any]:
     """
     STANDALONE PERFORMANCE TEST: Test data upload throughput by uploading multiple files.
     Configurable for any scale (e.g., 100MB files, 50 files).
@@ -2000,6 +2453,10 @@ async def performance_test_data_upload_throughput(user_name: str, project_name:
         project_name (str): The project name to test uploads
         file_size_mb (int): Size of each test file in MB (default: 10, can be 100+ MB)
         file_count (int): Number of files to upload (default: 5, can be 50+)
+        concurrency (int): Maximum number of files generated and uploaded at once (default: 1).
+            At 1 each file's throughput_mbps is a single-stream figure comparable with earlier
+            reports; higher values measure contended bandwidth and keep up to that many
+            file_size_mb temp files on disk at the same time.
     
     Example Usage:
         - Small test: file_size_mb=10, file_count=5
@@ -2016,6 +2473,8 @@ async def performance_test_data_upload_throughput(user_name: str, project_name:
         "timestamp": datetime.datetime.now().isoformat(),
         "operations": {}
     }
+    # Failed operation names are collected as results are recorded, not by rescanning at the end
+    failed_ops = []
     
     try:
         # Ensure project exists
@@ -2033,116 +2492,103 @@ async def performance_test_data_upload_throughput(user_name: str, project_name:
                 dataset_name,
                 f"Performance test dataset for upload throughput testing"
             )
-            test_results["operations"]["create_dataset"] = dataset_result
+            _record_operation(test_results, failed_ops, "create_dataset", dataset_result)
             
             if dataset_result["status"] == "PASSED":
                 dataset_id = dataset_result["result"].get("id")
                 
                 try:
-                    import tempfile
-                    import os
                     
-                    start_time = time.time()
+                    start_time = time.perf_counter()
                     total_bytes = 0
                     upload_results = []
                     
-                    print(f"📁 Preparing {file_count} test files of {file_size_mb}MB each...")
+                    log.info("Preparing %d test files of %dMB each...", file_count, file_size_mb)
                     
-                    for i in range(file_count):
-                        # Generate test data
-                        try:
-                            import pandas as pd
-                            import numpy as np
-                            
-                            # Calculate rows needed for approximately file_size_mb MB
-                            rows_needed = (file_size_mb * 1024 * 1024) // (8 * 10)  # Rough estimate
-                            
-                            test_data = pd.DataFrame({
-                                'id': range(rows_needed),
-                                'timestamp': [datetime.datetime.now().isoformat()] * rows_needed,
-                                'value1': np.random.randn(rows_needed),
-                                'value2': np.random.randn(rows_needed),
-                                'value3': np.random.randn(rows_needed),
-                                'value4': np.random.randn(rows_needed),
-                                'value5': np.random.randn(rows_needed),
-                                'category': [f'category_{j % 100}' for j in range(rows_needed)],
-                                'description': [f'test_data_row_{j}' for j in range(rows_needed)]
-                            })
-                            
-                        except ImportError:
-                            # Fallback if pandas/numpy not available
-                            rows_needed = (file_size_mb * 1024 * 1024) // 100  # Rough estimate
-                            test_data_lines = []
-                            test_data_lines.append("id,timestamp,value1,value2,description")
-                            for j in range(rows_needed):
-                                test_data_lines.append(f"{j},{datetime.datetime.now().isoformat()},{j*0.1},{j*0.2},test_data_row_{j}")
-                            test_data_content = "\n".join(test_data_lines)
-                        
-                        # Save to temp file
-                        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-                            if 'test_data' in locals() and hasattr(test_data, 'to_csv'):
-                                test_data.to_csv(f.name, index=False)
-                            else:
-                                f.write(test_data_content)
+                    def upload_one(i):
+                        """Generates, uploads and removes one test file, returning its stats"""
+                        # Generate the test file by streaming pre-built CSV blocks straight to disk
+                        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as f:
+                            _write_upload_test_file(f, file_size_mb * _MIB)
                             temp_file_path = f.name
                         
-                        # Get actual file size
-                        actual_size = os.path.getsize(temp_file_path)
-                        total_bytes += actual_size
+                        try:
+                            # Get actual file size
+                            actual_size = os.path.getsize(temp_file_path)
+                            
+                            # Upload file
+                            file_start_time = time.perf_counter()
+                            upload_result = _safe_execute(
+                                domino.datasets_upload_files,
+                                f"Upload test file {i+1}",
+                                dataset_id,
+                                temp_file_path
+                            )
+                            upload_time = time.perf_counter() - file_start_time
+                        finally:
+                            # Clean up temp file
+                            os.unlink(temp_file_path)
                         
-                        # Upload file
-                        file_start_time = time.time()
-                        upload_result = _safe_execute(
-                            domino.datasets_upload_files,
-                            f"Upload test file {i+1}",
-                            dataset_id,
-                            temp_file_path
-                        )
-                        upload_time = time.time() - file_start_time
+                        log.debug("   File %d/%d: %.1fMB uploaded in %.2fs", i + 1, file_count, actual_size * _BYTES_TO_MIB, upload_time)
                         
-                        upload_results.append({
+                        upload_stats = {
                             "file_index": i + 1,
                             "file_size_bytes": actual_size,
                             "upload_time_seconds": upload_time,
-                            "throughput_mbps": (actual_size / (1024*1024)) / upload_time if upload_time > 0 else 0,
+                            "throughput_mbps": actual_size * _BYTES_TO_MIB / upload_time if upload_time > 0 else 0,
                             "status": upload_result["status"]
-                        })
-                        
-                        test_results["operations"][f"upload_file_{i+1}"] = upload_result
-                        
-                        # Clean up temp file
-                        os.unlink(temp_file_path)
-                        
-                        print(f"   📤 File {i+1}/{file_count}: {actual_size/(1024*1024):.1f}MB uploaded in {upload_time:.2f}s")
+                        }
+                        if "error" in upload_result:
+                            upload_stats["error"] = upload_result["error"]
+                        return upload_stats
+                    
+                    # Files are generated and uploaded by up to `concurrency` workers at once, so one
+                    # file's generation overlaps another's upload
+                    outcomes = await _run_in_queue(upload_one, [(i,) for i in range(file_count)], concurrency)
+                    
+                    # Per-file detail lives only in upload_results; operations get a status tally
+                    upload_counts = Counter()
+                    for i, upload_stats in enumerate(outcomes):
+                        if isinstance(upload_stats, Exception):
+                            upload_stats = {"file_index": i + 1, "file_size_bytes": 0, "upload_time_seconds": 0, "throughput_mbps": 0, "status": "FAILED", "error": str(upload_stats)}
+                        upload_results.append(upload_stats)
+                        total_bytes += upload_stats["file_size_bytes"]
+                        upload_counts[upload_stats["status"]] += 1
+                    
+                    _record_operation(test_results, failed_ops, "upload_files", {
+                        "status": "FAILED" if upload_counts["FAILED"] else "PASSED",
+                        "description": "Upload test files",
+                        "result": dict(upload_counts)
+                    })
                     
                     # Calculate overall performance metrics
-                    total_time = time.time() - start_time
-                    successful_uploads = sum(1 for result in upload_results if result["status"] == "PASSED")
+                    total_time = time.perf_counter() - start_time
+                    successful_uploads = upload_counts["PASSED"]
                     
-                    test_results["operations"]["performance_metrics"] = {
+                    _record_operation(test_results, failed_ops, "performance_metrics", {
                         "status": "PASSED",
                         "description": "Upload performance metrics",
                         "result": {
                             "total_files": file_count,
                             "successful_uploads": successful_uploads,
                             "total_bytes": total_bytes,
-                            "total_mb": total_bytes / (1024*1024),
+                            "total_mb": total_bytes * _BYTES_TO_MIB,
                             "total_time_seconds": total_time,
-                            "average_throughput_mbps": (total_bytes / (1024*1024)) / total_time if total_time > 0 else 0,
+                            "concurrency": concurrency,
+                            "average_throughput_mbps": total_bytes * _BYTES_TO_MIB / total_time if total_time > 0 else 0,
                             "files_per_second": successful_uploads / total_time if total_time > 0 else 0,
                             "individual_uploads": upload_results
                         }
-                    }
+                    })
                     
                 except Exception as e:
-                    test_results["operations"]["file_upload_error"] = {
+                    _record_operation(test_results, failed_ops, "file_upload_error", {
                         "status": "FAILED",
                         "error": str(e),
                         "description": "File upload performance test"
-                    }
+                    })
             
             # Determine overall status
-            failed_ops = [k for k, v in test_results["operations"].items() if v["status"] == "FAILED"]
             test_results["status"] = "FAILED" if failed_ops else "PASSED"
             test_results["failed_operations"] = failed_ops
             
@@ -2205,6 +2651,8 @@ async def performance_test_parallel_workspaces(user_name: str, project_name: str
         "operations": {},
         "workspace_results": []
     }
+    # Failed operation names are collected as results are recorded, not by rescanning at the end
+    failed_ops = []
     
     try:
         # Ensure project exists
@@ -2212,18 +2660,18 @@ async def performance_test_parallel_workspaces(user_name: str, project_name: str
         test_results["project_setup"] = project_status
         
         if project_status["status"] in ["EXISTS", "CREATED", "CREATED_UNVERIFIED"]:
-            domino = _create_domino_client(user_name, project_name)
+            domino = await asyncio.to_thread(_create_domino_client, user_name, project_name)
             
-            print(f"🚀 Starting parallel workspace performance test with {workspace_count} workspaces")
-            print(f"⏱️ Test duration: {test_duration} seconds")
+            log.info("Starting parallel workspace performance test with %d workspaces", workspace_count)
+            log.info("Test duration: %d seconds", test_duration)
             
-            start_time = time.time()
-            workspace_launches = []
+            start_time = time.perf_counter()
             
             # Phase 1: Launch all workspaces in parallel
-            print(f"\n📋 PHASE 1: Launching {workspace_count} workspaces in parallel...")
+            log.info("PHASE 1: Launching %d workspaces in parallel...", workspace_count)
             
-            for i in range(workspace_count):
+            def launch_workspace(i):
+                """Launches one workspace, returning its summary (including the raw launch result)"""
                 workspace_name = f"perf-workspace-{i+1}-{datetime.datetime.now().strftime('%H%M%S')}"
                 
                 # Create unique test script for each workspace
@@ -2272,7 +2720,7 @@ print(f"🎯 Final result sum: {{result_sum}}")
 print(f"📅 End time: {{datetime.datetime.now().isoformat()}}")
 """
                 
-                workspace_launch_start = time.time()
+                workspace_launch_start = time.perf_counter()
                 
                 try:
                     # Launch workspace with performance test script
@@ -2290,7 +2738,7 @@ print(f"📅 End time: {{datetime.datetime.now().isoformat()}}")
                         f"Parallel Workspace Performance Test {i+1} - {workspace_name}"
                     )
                     
-                    workspace_launch_time = time.time() - workspace_launch_start
+                    workspace_launch_time = time.perf_counter() - workspace_launch_start
                     
                     workspace_info = {
                         "workspace_id": i + 1,
@@ -2301,58 +2749,78 @@ print(f"📅 End time: {{datetime.datetime.now().isoformat()}}")
                         "status": workspace_result["status"]
                     }
                     
-                    workspace_launches.append(workspace_info)
-                    test_results["operations"][f"launch_workspace_{i+1}"] = workspace_result
-                    
                     if workspace_result["status"] == "PASSED":
-                        print(f"   ✅ Workspace {i+1} launched successfully (ID: {workspace_info['run_id']}, Launch time: {workspace_launch_time:.2f}s)")
+                        log.debug("   Workspace %d launched successfully (ID: %s, Launch time: %.2fs)", i + 1, workspace_info["run_id"], workspace_launch_time)
                     else:
-                        print(f"   ❌ Workspace {i+1} failed to launch: {workspace_result.get('error', 'Unknown error')}")
+                        log.warning("   Workspace %d failed to launch: %s", i + 1, workspace_result.get("error", "Unknown error"))
+                    return workspace_info
                         
                 except Exception as e:
                     workspace_info = {
                         "workspace_id": i + 1,
                         "workspace_name": workspace_name,
-                        "launch_time": time.time() - workspace_launch_start,
+                        "launch_time": time.perf_counter() - workspace_launch_start,
                         "launch_result": {"status": "FAILED", "error": str(e)},
                         "run_id": None,
                         "status": "FAILED"
                     }
-                    workspace_launches.append(workspace_info)
-                    print(f"   ❌ Workspace {i+1} launch exception: {e}")
+                    log.warning("   Workspace %d launch exception: %s", i + 1, e)
+                    return workspace_info
+            
+            # runs_start_blocking holds its worker until the run finishes, so the queue bounds
+            # how many workspaces are launched (and held open) against Domino at once
+            workspace_launches = await _run_in_queue(launch_workspace, [(i,) for i in range(workspace_count)], _PERF_QUEUE_WORKERS)
+            
+            # Each launch's raw result is kept once, in workspace_results; operations get a tally
+            launch_counts = Counter(w["status"] for w in workspace_launches)
+            _record_operation(test_results, failed_ops, "launch_workspaces", {
+                "status": "FAILED" if launch_counts["FAILED"] else "PASSED",
+                "description": "Launch parallel workspaces",
+                "result": dict(launch_counts)
+            })
             
             # Phase 2: Monitor parallel execution
-            print(f"\n📊 PHASE 2: Monitoring parallel workspace execution...")
+            log.info("PHASE 2: Monitoring parallel workspace execution...")
             successful_launches = [w for w in workspace_launches if w["status"] == "PASSED"]
             
             if successful_launches:
-                # Wait for test duration while monitoring
-                monitor_start = time.time()
-                while (time.time() - monitor_start) < test_duration:
-                    elapsed = time.time() - monitor_start
-                    remaining = test_duration - elapsed
-                    print(f"   ⏱️ Monitoring parallel execution... {elapsed:.1f}s elapsed, {remaining:.1f}s remaining")
-                    await asyncio.sleep(5)  # Check every 5 seconds
-                
-                # Phase 3: Collect results and performance metrics
-                print(f"\n📈 PHASE 3: Collecting performance metrics...")
-                
-                for workspace in successful_launches:
+                # Poll every run concurrently with backoff (1s doubling to 5s) until it reaches a
+                # terminal state, so the phase ends as soon as all runs finish; test_duration
+                # only caps how long a still-running workspace is watched
+                monitor_deadline = time.perf_counter() + test_duration
+                
+                async def monitor_workspace(workspace):
+                    delay = 1
                     try:
-                        if workspace["run_id"]:
-                            # Get final status and results
-                            status_result = _safe_execute(
+                        while True:
+                            status_result = await asyncio.to_thread(
+                                _safe_execute,
                                 domino.runs_status,
                                 f"Get status for workspace {workspace['workspace_id']}",
                                 workspace["run_id"]
                             )
-                            workspace["final_status"] = status_result
-                            test_results["operations"][f"status_workspace_{workspace['workspace_id']}"] = status_result
+                            run_status = status_result.get("result")
+                            if (status_result["status"] != "PASSED"
+                                    or (isinstance(run_status, dict) and run_status.get("status") in _TERMINAL_RUN_STATES)
+                                    or time.perf_counter() >= monitor_deadline):
+                                return workspace, status_result
+                            await asyncio.sleep(min(delay, max(0, monitor_deadline - time.perf_counter())))
+                            delay = min(delay * 2, 5)
                     except Exception as e:
-                        workspace["final_status"] = {"status": "FAILED", "error": str(e)}
+                        return workspace, {"status": "FAILED", "error": str(e)}
+                
+                # Phase 3: Collect results and performance metrics as each run finishes
+                log.info("PHASE 3: Collecting performance metrics...")
+                
+                monitors = [monitor_workspace(w) for w in successful_launches if w["run_id"]]
+                for monitor in asyncio.as_completed(monitors):
+                    workspace, status_result = await monitor
+                    workspace["final_status"] = status_result
+                    _record_operation(test_results, failed_ops, f"status_workspace_{workspace['workspace_id']}", status_result)
+                    log.debug("   Workspace %d settled after %.1fs", workspace["workspace_id"], time.perf_counter() - start_time)
             
             # Calculate performance metrics
-            total_test_time = time.time() - start_time
+            total_test_time = time.perf_counter() - start_time
             successful_count = len(successful_launches)
             failed_count = workspace_count - successful_count
             
@@ -2365,7 +2833,7 @@ print(f"📅 End time: {{datetime.datetime.now().isoformat()}}")
                 avg_launch_time = max_launch_time = min_launch_time = 0
             
             test_results["workspace_results"] = workspace_launches
-            test_results["operations"]["performance_summary"] = {
+            _record_operation(test_results, failed_ops, "performance_summary", {
                 "status": "PASSED",
                 "description": "Parallel workspace performance summary",
                 "result": {
@@ -2380,10 +2848,9 @@ print(f"📅 End time: {{datetime.datetime.now().isoformat()}}")
                     "workspaces_per_minute": (successful_count / total_test_time) * 60 if total_test_time > 0 else 0,
                     "parallel_efficiency": f"{(successful_count / workspace_count) * 100:.1f}%" if workspace_count > 0 else "0%"
                 }
-            }
+            })
             
             # Determine overall status
-            failed_ops = [k for k, v in test_results["operations"].items() if v["status"] == "FAILED"]
             test_results["status"] = "FAILED" if failed_count > (workspace_count * 0.5) else "PASSED"  # Pass if >50% succeed
             test_results["failed_operations"] = failed_ops
             
@@ -2422,6 +2889,12 @@ print(f"📅 End time: {{datetime.datetime.now().isoformat()}}")
 
 ## Note: test_dataset_creation_and_upload has been removed in favor of enhanced_test_dataset_operations
 
+def _write_temp_file(content: str, suffix: str) -> str:
+    """Writes content to a new temporary file and returns its path; the caller deletes it"""
+    with tempfile.NamedTemporaryFile(mode='w', suffix=suffix, delete=False) as f:
+        f.write(content)
+        return f.name
+
 @mcp.tool()
 async def test_file_management_operations(user_name: str, project_name: str) -> Dict[str, Any]:
     """
@@ -2447,18 +2920,42 @@ async def test_file_management_operations(user_name: str, project_name: str) ->
         test_results["project_setup"] = project_status
         
         if project_status["status"] in ["EXISTS", "CREATED", "CREATED_UNVERIFIED"]:
-            domino = _create_domino_client(user_name, project_name)
+            domino = await asyncio.to_thread(_create_domino_client, user_name, project_name)
+            
+            # Create a test file
+            test_content = f"""# UAT Test File
+# Generated at: {datetime.datetime.now().isoformat()}
+# Purpose: Testing file upload capabilities
+
+def uat_test_function():
+    '''Simple test function for UAT validation'''
+    return "UAT test file executed successfully"
+
+if __name__ == "__main__":
+    print("UAT Test File executed successfully")
+    result = uat_test_function()
+    print(result)
+"""
+            
+            # The commit lookup for the initial listing and writing the upload file are
+            # independent, so the runs_list round trip overlaps the local disk write
+            runs_result, temp_file_path = await asyncio.gather(
+                asyncio.to_thread(domino.runs_list),
+                asyncio.to_thread(_write_temp_file, test_content, ".py"),
+                return_exceptions=True
+            )
             
             # Test 1: List current files
             # Get the latest commit ID first
             try:
-                runs_result = domino.runs_list()
+                if isinstance(runs_result, BaseException):
+                    raise runs_result
                 if runs_result and 'data' in runs_result and len(runs_result['data']) > 0:
                     # Get the output commit ID from the latest run
                     latest_run = runs_result['data'][0]
                     commit_id = latest_run.get('outputCommitId') or latest_run.get('commitId')
                     if commit_id:
-                        list_result = _safe_execute(domino.files_list, "List project files", commit_id, "/")
+                        list_result = await asyncio.to_thread(_safe_execute, domino.files_list, "List project files", commit_id, "/")
                     else:
                         list_result = {
                             "status": "FAILED",
@@ -2481,49 +2978,32 @@ async def test_file_management_operations(user_name: str, project_name: str) ->
             
             # Test 2: Upload a test file
             try:
-                import tempfile
-                import os
-                
-                # Create a test file
-                test_content = f"""# UAT Test File
-# Generated at: {datetime.datetime.now().isoformat()}
-# Purpose: Testing file upload capabilities
-
-def uat_test_function():
-    '''Simple test function for UAT validation'''
-    return "UAT test file executed successfully"
-
-if __name__ == "__main__":
-    print("UAT Test File executed successfully")
-    result = uat_test_function()
-    print(result)
-"""
+                if isinstance(temp_file_path, BaseException):
+                    raise temp_file_path
                 
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                    f.write(test_content)
-                    temp_file_path = f.name
-                
-                upload_result = _safe_execute(
-                    domino.files_upload,
-                    "Upload test Python file",
-                    "uat_test_file.py",
-                    temp_file_path
-                )
+                try:
+                    upload_result = await asyncio.to_thread(
+                        _safe_execute,
+                        domino.files_upload,
+                        "Upload test Python file",
+                        "uat_test_file.py",
+                        temp_file_path
+                    )
+                finally:
+                    # Clean up temp file
+                    os.unlink(temp_file_path)
                 test_results["operations"]["upload_file"] = upload_result
                 
-                # Clean up temp file
-                os.unlink(temp_file_path)
-                
                 # Test 3: List files again to verify upload
                 if upload_result["status"] == "PASSED":
                     # Get the latest commit ID after upload
                     try:
-                        runs_result = domino.runs_list()
+                        runs_result = await asyncio.to_thread(domino.runs_list)
                         if runs_result and 'data' in runs_result and len(runs_result['data']) > 0:
                             latest_run = runs_result['data'][0]
                             commit_id = latest_run.get('outputCommitId') or latest_run.get('commitId')
                             if commit_id:
-                                verify_result = _safe_execute(domino.files_list, "Verify file upload", commit_id, "/")
+                                verify_result = await asyncio.to_thread(_safe_execute, domino.files_list, "Verify file upload", commit_id, "/")
                             else:
                                 verify_result = {
                                     "status": "FAILED",
@@ -2925,8 +3405,9 @@ async def run_comprehensive_advanced_uat_suite(user_name: str, project_name: str
         
         # Calculate overall results
         total_tests = len(suite_results["tests"])
-        passed_tests = sum(1 for result in suite_results["tests"].values() if result["status"] == "PASSED")
-        skipped_tests = sum(1 for result in suite_results["tests"].values() if result["status"] == "SKIPPED")
+        status_counts = Counter(result["status"] for result in suite_results["tests"].values())
+        passed_tests = status_counts["PASSED"]
+        skipped_tests = status_counts["SKIPPED"]
         failed_tests = total_tests - passed_tests - skipped_tests
         
         suite_results["end_time"] = datetime.datetime.now().isoformat()
@@ -3106,10 +3587,7 @@ async def _cleanup_test_resources(resources_created: list, user_name: str, proje
         "status": "RUNNING"
     }
     
-    headers = {
-        "X-Domino-Api-Key": domino_api_key,
-        "Content-Type": "application/json"
-    }
+    headers = _AUTH_HEADERS
     
     try:
         # Get project ID
@@ -3339,10 +3817,7 @@ async def test_workspace_hardware_tiers(user_name: str, project_name: str) -> Di
         # Ensure project exists
         await create_project_if_needed(user_name, project_name)
         
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         project_id = _get_project_id(user_name, project_name, headers)
         
         # Get available hardware tiers - only test specific tier IDs
@@ -3718,10 +4193,7 @@ async def test_workspace_file_sync(user_name: str, project_name: str) -> Dict[st
         # Ensure project exists
         await create_project_if_needed(user_name, project_name)
         
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         project_id = _get_project_id(user_name, project_name, headers)
         
         print(f"🔄 Testing Workspace File Sync...")
@@ -4002,10 +4474,7 @@ async def test_admin_hardware_tiers(user_name: str, project_name: str) -> Dict[s
     }
     
     try:
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
         print(f"🔧 Testing Admin Hardware Tiers API...")
         
@@ -4080,10 +4549,7 @@ async def test_admin_organizations(user_name: str, project_name: str) -> Dict[st
     }
     
     try:
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
         print(f"🏢 Testing Admin Organizations API...")
         
@@ -4439,10 +4905,7 @@ async def test_comprehensive_ide_workspace_suite(user_name: str, project_name: s
             {"name": "vscode", "display": "💻 VSCode", "tools": ["vscode"]}
         ]
         
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         project_id = _get_project_id(user_name, project_name, headers)
         
         for ide_config in ides_to_test:
@@ -4613,7 +5076,6 @@ async def test_comprehensive_ide_workspace_suite(user_name: str, project_name: s
                 sys.stdout.flush()
                 
             except Exception as e:
-                import traceback
                 ide_result["status"] = "FAILED"
                 ide_result["error"] = str(e)
                 ide_result["traceback"] = traceback.format_exc()
@@ -4663,7 +5125,6 @@ async def test_comprehensive_ide_workspace_suite(user_name: str, project_name: s
         return test_results
         
     except Exception as e:
-        import traceback
         test_results["status"] = "ERROR"
         test_results["error"] = str(e)
         test_results["traceback"] = traceback.format_exc()
@@ -4907,7 +5368,6 @@ async def cleanup_all_project_workspaces(user_name: str, project_name: str) -> D
         if not isinstance(workspaces, list):
             workspaces = []
 
-        import time
         for ws in workspaces:
             ws_id = ws.get("id")
             ws_name = ws.get("name")
@@ -6432,10 +6892,7 @@ async def test_admin_execution_management(user_name: str, project_name: str) ->
     
     try:
         domino = _create_domino_client(user_name, project_name)
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
         print("🔧 Testing Admin Execution Management...")
         
@@ -6683,10 +7140,7 @@ async def test_admin_infrastructure_management(user_name: str, project_name: str
     
     try:
         domino = _create_domino_client(user_name, project_name)
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
         print("🏗️ Testing Admin Infrastructure Management...")
         
@@ -6873,10 +7327,7 @@ async def test_admin_configuration_management(user_name: str, project_name: str)
     
     try:
         domino = _create_domino_client(user_name, project_name)
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
         print("⚙️ Testing Admin Configuration Management...")
         
@@ -7018,10 +7469,7 @@ async def test_admin_monitoring_notifications(user_name: str, project_name: str)
     
     try:
         domino = _create_domino_client(user_name, project_name)
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
         print("📊 Testing Admin Monitoring & Notifications...")
         
@@ -7185,10 +7633,7 @@ async def test_admin_security_auditing(user_name: str, project_name: str) -> Dic
     
     try:
         domino = _create_domino_client(user_name, project_name)
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
         print("🔒 Testing Admin Security & Auditing...")
         
@@ -7405,8 +7850,9 @@ async def run_admin_portal_uat_suite(user_name: str, project_name: str) -> Dict[
         # Calculate comprehensive results
         all_categories = suite_results["admin_categories"]
         total_categories = len(all_categories)
-        passed_categories = sum(1 for result in all_categories.values() if result.get("status") == "PASSED")
-        partial_categories = sum(1 for result in all_categories.values() if result.get("status") == "PARTIAL")
+        status_counts = Counter(result.get("status") for result in all_categories.values())
+        passed_categories = status_counts["PASSED"]
+        partial_categories = status_counts["PARTIAL"]
         failed_categories = total_categories - passed_categories - partial_categories
         
         # Calculate detailed statistics
@@ -7596,8 +8042,8 @@ print('Capacity test job {i+1} completed')
         }
 
         # Calculate summary
-        total_tests = len([t for t in admin_results["tests"].values() if isinstance(t, dict) and "status" in t])
-        passed_tests = len([t for t in admin_results["tests"].values() if isinstance(t, dict) and t.get("status") == "PASSED"])
+        total_tests = sum(1 for t in admin_results["tests"].values() if isinstance(t, dict) and "status" in t)
+        passed_tests = sum(1 for t in admin_results["tests"].values() if isinstance(t, dict) and t.get("status") == "PASSED")
         
         admin_results["summary"] = {
             "total_tests": total_tests,
@@ -7643,15 +8089,15 @@ async def run_user_uat_suite(user_name: str, project_name: str) -> Dict[str, Any
     }
 
     try:
-        print("👤 Running User UAT Suite...")
+        log.info("Running User UAT Suite...")
         
         # User Test 1: Authentication and Project Access
-        print("🔐 Testing user authentication and project access...")
+        log.info("Testing user authentication and project access...")
         auth_test = await test_user_authentication(user_name, project_name)
         user_results["tests"]["authentication"] = auth_test
         
         # User Test 2: Data Science Workflows
-        print("🔬 Testing data science workflows...")
+        log.info("Testing data science workflows...")
         
         # Test Python workflow
         python_job_test = await test_job_execution(user_name, project_name, "python")
@@ -7662,33 +8108,33 @@ async def run_user_uat_suite(user_name: str, project_name: str) -> Dict[str, Any
         user_results["tests"]["dataset_access"] = dataset_test
         
         # User Test 3: Workspace Operations
-        print("💻 Testing workspace operations...")
+        log.info("Testing workspace operations...")
         workspace_test = await test_workspace_operations(user_name, project_name)
         user_results["tests"]["workspace_operations"] = workspace_test
         
         # User Test 4: File Management (2.2 Spec - Upload files)
-        print("📄 Testing file management...")
+        log.info("Testing file management...")
         file_test = await test_file_management_operations(user_name, project_name)
         user_results["tests"]["file_management"] = file_test
         
         # User Test 6: Environment Revision Build (2.1 Spec)
-        print("🌐 Testing environment revision build...")
+        log.info("Testing environment revision build...")
         env_build_test = await test_post_upgrade_env_rebuild(user_name, project_name)
         user_results["tests"]["environment_revision_build"] = env_build_test
         
         # User Test 7: Collaboration Features
-        print("🤝 Testing collaboration features...")
+        log.info("Testing collaboration features...")
         collab_test = await test_collaboration_features(user_name, project_name)
         user_results["tests"]["collaboration"] = collab_test
         
         # User Test 8: Model Operations
-        print("🤖 Testing model operations...")
+        log.info("Testing model operations...")
         model_test = await enhanced_test_model_operations(user_name, project_name)
         user_results["tests"]["model_operations"] = model_test
 
         # Calculate summary
         total_tests = len(user_results["tests"])
-        passed_tests = len([t for t in user_results["tests"].values() if t.get("status") == "PASSED"])
+        passed_tests = sum(1 for t in user_results["tests"].values() if t.get("status") == "PASSED")
         
         user_results["summary"] = {
             "total_tests": total_tests,
@@ -7738,27 +8184,21 @@ async def run_user_uat_suite(user_name: str, project_name: str) -> Dict[str, Any
     }
 
     try:
-        print("🎯 Starting Comprehensive Split UAT Suite...")
+        log.info("Starting Comprehensive Split UAT Suite...")
         
         # Run Admin UAT
-        print("\n" + "="*60)
-        print("🔧 ADMINISTRATIVE UAT TESTING")
-        print("="*60)
+        log.info("ADMINISTRATIVE UAT TESTING")
         admin_results = await run_admin_uat_suite(user_name, project_name)
         comprehensive_results["admin_uat"] = admin_results
         
         # Run User UAT  
-        print("\n" + "="*60)
-        print("👤 USER UAT TESTING")
-        print("="*60)
+        log.info("USER UAT TESTING")
         user_results = await run_user_uat_suite(user_name, project_name)
         comprehensive_results["user_uat"] = user_results
         
         # Optional Performance Tests
         if include_performance:
-            print("\n" + "="*60)
-            print("⚡ PERFORMANCE TESTING")
-            print("="*60)
+            log.info("PERFORMANCE TESTING")
             
             perf_job_test = await performance_test_concurrent_jobs(user_name, project_name, 3, 10)
             comprehensive_results["performance_tests"]["concurrent_jobs"] = perf_job_test
@@ -7792,14 +8232,12 @@ async def run_user_uat_suite(user_name: str, project_name: str) -> Dict[str, Any
         comprehensive_results["status"] = comprehensive_results["final_summary"]["overall_status"]
         comprehensive_results["message"] = f"Comprehensive UAT completed: {total_passed}/{total_tests} tests passed ({overall_success_rate:.1f}%)"
 
-        # Print final summary
-        print("\n" + "="*60)
-        print("📊 COMPREHENSIVE UAT SUMMARY")
-        print("="*60)
-        print(f"🔧 Admin Tests: {admin_passed}/{admin_total} passed ({admin_results.get('status', 'UNKNOWN')})")
-        print(f"👤 User Tests: {user_passed}/{user_total} passed ({user_results.get('status', 'UNKNOWN')})")
-        print(f"📈 Overall: {total_passed}/{total_tests} passed ({overall_success_rate:.1f}%)")
-        print(f"🎯 Final Status: {comprehensive_results['status']}")
+        # Log final summary
+        log.info("COMPREHENSIVE UAT SUMMARY")
+        log.info("Admin Tests: %s/%s passed (%s)", admin_passed, admin_total, admin_results.get('status', 'UNKNOWN'))
+        log.info("User Tests: %s/%s passed (%s)", user_passed, user_total, user_results.get('status', 'UNKNOWN'))
+        log.info("Overall: %s/%s passed (%.1f%%)", total_passed, total_tests, overall_success_rate)
+        log.info("Final Status: %s", comprehensive_results['status'])
 
         return comprehensive_results
         
@@ -7811,6 +8249,19 @@ async def run_user_uat_suite(user_name: str, project_name: str) -> Dict[str, Any
         })
         return comprehensive_results
 
+# Run states after which check_domino_job_run_status will not change any more
+_TERMINAL_RUN_STATES = frozenset({"Succeeded", "Failed", "Stopped", "Error"})
+
+# Local MLflow run link, capturing experiment id and run id
+_MLFLOW_RUN_URL_RE = re.compile(r"http://127\.0\.0\.1:8768/#/experiments/(\d+)/runs/([a-f0-9]+)")
+
+# Whole lines (with their newline) that contain a local MLflow run link or "View experiment at:" link
+_MLFLOW_LINE_STRIP_RE = re.compile(
+    r"^.*(?:http://127\.0\.0\.1:8768/#/experiments/\d+/runs/[a-f0-9]+"
+    r"|View experiment at: http://127\.0\.0\.1:8768/#/experiments/\d+).*(?:\r?\n|$)",
+    re.MULTILINE
+)
+
 def _filter_domino_stdout(stdout_text: str) -> str:
     """
     Filters the stdout text from a Domino job run to extract the relevant output.
@@ -7839,10 +8290,7 @@ def _extract_and_format_mlflow_url(text: str, user_name: str, project_name: str)
     Finds an MLflow URL in the format http://127.0.0.1:8768/#/experiments/.../runs/...
     and reformats it to the Domino Cloud URL format.
     """
-    import re
-    # Regex to find the specific MLflow URL pattern
-    pattern = r"http://127\.0\.0\.1:8768/#/experiments/(\d+)/runs/([a-f0-9]+)"
-    match = re.search(pattern, text)
+    match = _MLFLOW_RUN_URL_RE.search(text)
 
     if match:
         experiment_id = match.group(1)
@@ -7872,12 +8320,6 @@ async def run_domino_job(user_name: str, project_name: str, run_command: str, ti
     # must be in this format: https://domino.host/v1/projects/user_name/project_name/runs
     api_url = f"{domino_host}/v1/projects/{encoded_user_name}/{encoded_project_name}/runs"
 
-    # Prepare the request headers
-    headers = {
-        "X-Domino-Api-Key": domino_api_key,
-        "Content-Type": "application/json",
-    }
-
     # Prepare the request body according to the specified requirements
     # for the /v1/projects/{user_name}/{project_name}/runs endpoint.
     # Always run via bash -lc to preserve quoting and shell features
@@ -7889,9 +8331,9 @@ async def run_domino_job(user_name: str, project_name: str, run_command: str, ti
     }
 
     try:
-        response = requests.post(api_url, headers=headers, json=payload)
+        response = _SESSION.post(api_url, json=payload)
         response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
-        result = response.json()
+        result = _json_loads(response.content)
     except requests.exceptions.RequestException as e:
         result = {"error": f"API request failed: {e}"}
     except Exception as e:
@@ -7915,13 +8357,11 @@ async def check_domino_job_run_status(user_name: str, project_name: str, run_id:
     encoded_run_id = _validate_url_parameter(run_id, "run_id")
     
     api_url = f"{domino_host}/v1/projects/{encoded_user_name}/{encoded_project_name}/runs/{encoded_run_id}"
-    headers = {
-        "X-Domino-Api-Key": domino_api_key
-    }
     try:
-        response = requests.get(api_url, headers=headers)
+        # Off the event loop, so await_domino_job_run_completion's concurrent polls really overlap
+        response = await asyncio.to_thread(_SESSION.get, api_url, timeout=30)
         response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
-        result = response.json()
+        result = _json_loads(response.content)
     except requests.exceptions.RequestException as e:
         result = {"error": f"API request failed: {e}"}
     except Exception as e:
@@ -7945,13 +8385,10 @@ async def check_domino_job_run_results(user_name: str, project_name: str, run_id
     encoded_run_id = _validate_url_parameter(run_id, "run_id")
     
     api_url = f"{domino_host}/v1/projects/{encoded_user_name}/{encoded_project_name}/run/{encoded_run_id}/stdout"
-    headers = {
-        "X-Domino-Api-Key": domino_api_key
-    }
     try:
-        response = requests.get(api_url, headers=headers)
+        response = _SESSION.get(api_url)
         response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
-        raw_stdout = response.json().get('stdout', '') # Use .get for safety
+        raw_stdout = _json_loads(response.content).get('stdout', '') # Use .get for safety
         
         # Initial filtering between markers
         initially_filtered_stdout = _filter_domino_stdout(raw_stdout)
@@ -7962,16 +8399,8 @@ async def check_domino_job_run_results(user_name: str, project_name: str, run_id
         final_filtered_stdout = initially_filtered_stdout
         # If MLflow URL was found, remove the original URL line(s) from the results
         if mlflow_url:
-            import re
-            # Define the pattern for the original local MLflow URL (run-specific)
-            local_mlflow_run_pattern = r"http://127\.0\.0\.1:8768/#/experiments/\d+/runs/[a-f0-9]+"
-            # Define the pattern for the experiment link
-            local_mlflow_experiment_pattern = r"View experiment at: http://127\.0\.0\.1:8768/#/experiments/\d+"
-            
-            # Split into lines, filter out lines containing either pattern, and rejoin
-            lines = initially_filtered_stdout.splitlines()
-            filtered_lines = [line for line in lines if not re.search(local_mlflow_run_pattern, line) and not re.search(local_mlflow_experiment_pattern, line)]
-            final_filtered_stdout = "\n".join(filtered_lines).strip()
+            # Drop every line carrying a local MLflow run or experiment link in one pass
+            final_filtered_stdout = _MLFLOW_LINE_STRIP_RE.sub("", initially_filtered_stdout).strip()
 
         # Construct the result dictionary
         result = {"results": final_filtered_stdout}
@@ -7985,6 +8414,49 @@ async def check_domino_job_run_results(user_name: str, project_name: str, run_id
 
     return result
 
+@mcp.tool()
+async def await_domino_job_run_completion(user_name: str, project_name: str, run_ids: List[str], timeout_seconds: int = 600) -> Dict[str, Any]:
+    """
+    The await_domino_job_run_completion function waits until one or more job runs have finished and returns their final status. Prefer this over calling check_domino_job_run_status repeatedly: each run is polled with exponential backoff (0.5s growing to 8s) and all runs are waited on concurrently.
+
+    Args:
+        user_name (str): The user name associated with the Domino Project
+        project_name (str): The name of the Domino project.
+        run_ids (List[str]): The run ids of the job runs to wait for
+        timeout_seconds (int): Overall time limit in seconds for all runs together, since they are waited on concurrently (default: 600)
+    """
+    deadline = time.monotonic() + timeout_seconds
+    
+    async def _await_run(run_id: str) -> Dict[str, Any]:
+        delay = 0.5
+        status = None
+        while True:
+            # Each poll is bounded by the time left, so a hung request cannot outlive the deadline;
+            # a bad run id only fails its own entry instead of the whole gather
+            try:
+                status = await asyncio.wait_for(
+                    check_domino_job_run_status(user_name, project_name, run_id),
+                    timeout=max(0, deadline - time.monotonic())
+                )
+            except asyncio.TimeoutError:
+                pass
+            except Exception as e:
+                return {"error": f"Could not check run {run_id}: {e}"}
+            else:
+                if "error" in status or status.get("status") in _TERMINAL_RUN_STATES:
+                    return status
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return {
+                    "error": f"Timed out after {timeout_seconds}s waiting for run {run_id}",
+                    "last_status": status
+                }
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, 8)
+
+    results = await asyncio.gather(*(_await_run(run_id) for run_id in run_ids))
+    return dict(zip(run_ids, results))
+
 @mcp.tool()
 def open_web_browser(url: str) -> bool:
     """Opens the specified URL in the default web browser.
@@ -8019,10 +8491,7 @@ async def test_real_workspace_apis(user_name: str, project_name: str) -> Dict[st
     }
     
     try:
-        headers = {
-            "X-Domino-Api-Key": domino_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _AUTH_HEADERS
         
         # Step 1: Ensure project exists and get project ID
         try:
@@ -8126,7 +8595,6 @@ async def test_real_workspace_apis(user_name: str, project_name: str) -> Dict[st
         }
         
         # Step 5: Check session status
-        import time
         time.sleep(5)  # Wait a bit before checking status
         
         status_result = _make_api_request(
@@ -9395,10 +9863,7 @@ async def test_environment_creation(user_name: str, project_name: str, environme
         }
         
         try:
-            headers = {
-                "X-Domino-Api-Key": domino_api_key,
-                "Content-Type": "application/json"
-            }
+            headers = _AUTH_HEADERS
             
             # Environment creation configuration
             env_config = {
@@ -9715,10 +10180,7 @@ async def test_environment_package_building(user_name: str, project_name: str, e
                 }
                 
                 try:
-                    headers = {
-                        "X-Domino-Api-Key": domino_api_key,
-                        "Content-Type": "application/json"
-                    }
+                    headers = _AUTH_HEADERS
                     
                     # Create environment build request
                     build_data = {
@@ -9807,10 +10269,7 @@ async def test_environment_package_building(user_name: str, project_name: str, e
                 }
                 
                 try:
-                    headers = {
-                        "X-Domino-Api-Key": domino_api_key,
-                        "Content-Type": "application/json"
-                    }
+                    headers = _AUTH_HEADERS
                     
                     # Create legacy environment build request
                     build_data = {
@@ -9926,10 +10385,7 @@ async def test_post_upgrade_env_rebuild(user_name: str, project_name: str) -> Di
         }
         
         try:
-            headers = {
-                "X-Domino-Api-Key": domino_api_key,
-                "Content-Type": "application/json"
-            }
+            headers = _AUTH_HEADERS
             
             # Get environment from workspace (this method works)
             projects_response = requests.get(f"{domino_host}/v4/projects", headers=headers, params={'pageSize': 100})
@@ -10391,10 +10847,7 @@ print("Environment setup completed")
                         }
                         
                         # Simulate script migration API call
-                        headers = {
-                            "X-Domino-Api-Key": domino_api_key,
-                            "Content-Type": "application/json"
-                        }
+                        headers = _AUTH_HEADERS
                         
                         migration_endpoint = f"{domino_host}/v4/environments/migration-scripts"
                         migration_result = _make_api_request("POST", migration_endpoint, headers, data=migration_config)
@@ -10511,10 +10964,7 @@ async def test_project_copying(user_name: str, source_project_name: str, target_
         }
         
         try:
-            headers = {
-                "X-Domino-Api-Key": domino_api_key,
-                "Content-Type": "application/json"
-            }
+            headers = _AUTH_HEADERS
             
             # Get source project ID
             project_id = _get_project_id(user_name, source_project_name, headers)
@@ -10644,10 +11094,7 @@ async def test_project_forking(user_name: str, source_project_name: str, fork_pr
         }
         
         try:
-            headers = {
-                "X-Domino-Api-Key": domino_api_key,
-                "Content-Type": "application/json"
-            }
+            headers = _AUTH_HEADERS
             
             # Get source project ID
             project_id = _get_project_id(user_name, source_project_name, headers)
@@ -10828,10 +11275,7 @@ def new_function():
         }
         
         try:
-            headers = {
-                "X-Domino-Api-Key": domino_api_key,
-                "Content-Type": "application/json"
-            }
+            headers = _AUTH_HEADERS
             
             # File reversion configuration
             reversion_config = {
@@ -11008,7 +11452,6 @@ async def test_file_download(user_name: str, project_name: str) -> Dict[str, Any
         download_op = {"operation": "download_file", "file": target_name, "url": target_blob_url}
         if target_blob_url:
             try:
-                import requests
                 resp = requests.get(target_blob_url, headers={"X-Domino-Api-Key": domino_api_key})
                 download_op["status_code"] = resp.status_code
                 download_op["content_length"] = len(resp.content or b"")
@@ -11334,10 +11777,7 @@ async def test_dataset_mounting(user_name: str, project_name: str, dataset_name:
         }
         
         try:
-            headers = {
-                "X-Domino-Api-Key": domino_api_key,
-                "Content-Type": "application/json"
-            }
+            headers = _AUTH_HEADERS
             
             # Dataset snapshot configuration
             snapshot_config = {
@@ -11369,10 +11809,7 @@ async def test_dataset_mounting(user_name: str, project_name: str, dataset_name:
         
         # Workspace lifecycle using helpers (create -> start -> stop -> delete)
         try:
-            headers = {
-                "X-Domino-Api-Key": domino_api_key,
-                "Content-Type": "application/json"
-            }
+            headers = _AUTH_HEADERS
             project_id = _get_project_id(user_name, project_name, headers)
             if not project_id:
                 pid_fallback = await _get_project_id_from_swagger(user_name, project_name)
@@ -11695,8 +12132,6 @@ async def run_progressive_uat_suite(user_name: str, project_name: str, collabora
     Runs a progressive UAT suite with clear progress reporting and 1-minute timeouts.
     Each test step is reported with status and any failures are clearly identified.
     """
-    import concurrent.futures
-    import time
     
     suite_results = {
         "test_suite": "Progressive UAT Suite",
@@ -12194,9 +12629,21 @@ Test X/14: Test Name — ✅ PASSED
 **Begin execution immediately - no confirmation needed.**
 """
 
+def _warm_session() -> None:
+    """Open a pooled keep-alive connection to the Domino host so the first tool call skips the TLS handshake"""
+    try:
+        _SESSION.get(f"{domino_host}/v4/auth/principal", timeout=5)
+    except requests.exceptions.RequestException:
+        pass
+
 def main():
     """Initializes and runs the Domino QA MCP server."""
-    mcp.run(transport='stdio')
+    # Warm the connection pool in the background while the stdio transport starts up
+    threading.Thread(target=_warm_session, name="qa-mcp-warmup", daemon=True).start()
+    try:
+        mcp.run(transport='stdio')
+    finally:
+        _SESSION.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file